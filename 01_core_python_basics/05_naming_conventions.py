@@ -7,6 +7,13 @@ This script demonstrates all naming conventions covered in the video lecture
 with practical MLOps examples that show why good naming matters.
 """
 
+import os
+import queue
+import random
+import threading
+
+import numpy as np
+
 # ============================================================================
 # CONSTANTS - UPPER_CASE with underscores (module-level configuration)
 # ============================================================================
@@ -20,6 +27,8 @@ LEARNING_RATE = 0.001    # Default learning rate
 MODEL_CHECKPOINT_DIR = "/models/checkpoints"
 VALIDATION_SPLIT = 0.2
 EARLY_STOPPING_PATIENCE = 10
+DEFAULT_PREFETCH_BATCHES = 4  # Batches loaded ahead of the training loop
+INITIAL_HISTORY_CAPACITY = 64  # Rows preallocated by TrainingHistory
 
 
 # ============================================================================
@@ -80,26 +89,188 @@ class DataLoader:
     Bad: dataLoader, model_trainer, featureextractor
     """
     
-    def __init__(self, data_path):
+    _END_OF_EPOCH = object()  # Sentinel put on the prefetch queue after the last batch
+    
+    def __init__(self, data_path, batch_size=DEFAULT_BATCH_SIZE, shuffle=False,
+                 seed=None, prefetch_batches=DEFAULT_PREFETCH_BATCHES):
         # Instance variables use snake_case
         self.data_path = data_path
-        self.batch_size = DEFAULT_BATCH_SIZE
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.prefetch_batches = prefetch_batches
         self.is_loaded = False
+        self.epoch = 0  # Next epoch for plain iteration (for batch in loader)
         
         # Private attributes start with underscore
-        self._cache = None
-        self._last_modified = None
-    
-    def get_batch(self, batch_index):
+        self._cache = None          # Byte offset of every sample line
+        self._last_modified = None  # File mtime when the offsets were built
+    
+    def _sample_offsets(self):
+        """Index line offsets once; rebuild only if the file changed."""
+        modified_time = os.path.getmtime(self.data_path)
+        if self._cache is None or modified_time != self._last_modified:
+            offsets = []
+            position = 0
+            with open(self.data_path, "rb") as data_file:
+                for line in data_file:
+                    if line.strip():
+                        offsets.append(position)
+                    position += len(line)
+            self._cache = offsets
+            self._last_modified = modified_time
+            self.is_loaded = True
+        return self._cache
+    
+    def __len__(self):
+        """Number of batches per epoch."""
+        sample_count = len(self._sample_offsets())
+        return (sample_count + self.batch_size - 1) // self.batch_size
+    
+    def sample_order(self, epoch=0):
+        """Sample indices for one epoch - shuffled reproducibly when a seed is set."""
+        sample_indices = list(range(len(self._sample_offsets())))
+        if self.shuffle:
+            epoch_seed = None if self.seed is None else self.seed + epoch
+            random.Random(epoch_seed).shuffle(sample_indices)
+        return sample_indices
+    
+    def get_batch(self, batch_index, sample_order=None):
         """Method names use snake_case like functions."""
-        return f"Batch {batch_index} from {self.data_path}"
+        offsets = self._sample_offsets()
+        if sample_order is None:
+            sample_order = range(len(offsets))
+        batch_indices = sample_order[batch_index * self.batch_size:(batch_index + 1) * self.batch_size]
+        batch_samples = []
+        with open(self.data_path, "rb") as data_file:  # Own handle - safe from any thread
+            for sample_index in batch_indices:
+                data_file.seek(offsets[sample_index])
+                batch_samples.append(data_file.readline().decode("utf-8").rstrip("\r\n"))
+        return batch_samples
+    
+    def iter_batches(self, epoch=0):
+        """Yield batches while a background thread prefetches the next ones.
+        
+        Up to prefetch_batches batches wait in a bounded queue, so file I/O
+        overlaps with the training step that consumes the current batch.
+        """
+        sample_order = self.sample_order(epoch)
+        batch_count = len(self)
+        prefetch_queue = queue.Queue(maxsize=max(1, self.prefetch_batches))
+        stop_event = threading.Event()
+        
+        def put_until_stopped(item):
+            while not stop_event.is_set():
+                try:
+                    prefetch_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def prefetch_worker():
+            try:
+                for batch_index in range(batch_count):
+                    if not put_until_stopped(self.get_batch(batch_index, sample_order)):
+                        return  # Consumer stopped early
+            except Exception as error:  # Re-raised in the consumer thread
+                put_until_stopped(error)
+                return
+            put_until_stopped(self._END_OF_EPOCH)
+        
+        worker_thread = threading.Thread(target=prefetch_worker, daemon=True)
+        worker_thread.start()
+        try:
+            while True:
+                next_item = prefetch_queue.get()
+                if next_item is self._END_OF_EPOCH:
+                    break
+                if isinstance(next_item, Exception):
+                    raise next_item
+                yield next_item
+        finally:
+            stop_event.set()  # Lets the worker exit if the loop breaks early
+            worker_thread.join()
+    
+    def __iter__(self):
+        """Batches of the next epoch; each for-loop gets a new shuffle order."""
+        epoch, self.epoch = self.epoch, self.epoch + 1
+        return self.iter_batches(epoch)
+
+class TrainingHistory:
+    """Column store of (epoch, train_loss, val_loss) rows.
+
+    Rows live in preallocated NumPy arrays (int64 epoch, float64 losses)
+    that double in size when full, so appends are amortized O(1) and a
+    row costs 24 bytes instead of a dict. The epoch, train_loss and
+    val_loss properties are read-only zero-copy views; take new views
+    after further appends, since growing reallocates the arrays.
+    Indexing and iteration still yield dicts for existing callers.
+    """
+    
+    def __init__(self, capacity=INITIAL_HISTORY_CAPACITY):
+        self._epoch = np.empty(capacity, dtype=np.int64)
+        self._train_loss = np.empty(capacity, dtype=np.float64)
+        self._val_loss = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+    
+    def append(self, epoch, train_loss, val_loss):
+        """Add one row, doubling the arrays when they are full."""
+        if self._size == len(self._epoch):
+            self._grow(max(1, 2 * len(self._epoch)))
+        index = self._size
+        self._epoch[index] = epoch
+        self._train_loss[index] = train_loss
+        self._val_loss[index] = val_loss
+        self._size += 1
+    
+    def _grow(self, capacity):
+        for name in ('_epoch', '_train_loss', '_val_loss'):
+            old_column = getattr(self, name)
+            new_column = np.empty(capacity, dtype=old_column.dtype)
+            new_column[:self._size] = old_column[:self._size]
+            setattr(self, name, new_column)
+    
+    def _view(self, column):
+        view = column[:self._size]
+        view.flags.writeable = False  # Views are for reading (plots, early stopping)
+        return view
+    
+    @property
+    def epoch(self):
+        return self._view(self._epoch)
+    
+    @property
+    def train_loss(self):
+        return self._view(self._train_loss)
+    
+    @property
+    def val_loss(self):
+        return self._view(self._val_loss)
+    
+    def __len__(self):
+        return self._size
+    
+    def __getitem__(self, index):
+        """Row as a dict, e.g. history[-1]['val_loss']."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("training history index out of range")
+        return {'epoch': int(self._epoch[index]),
+                'train_loss': float(self._train_loss[index]),
+                'val_loss': float(self._val_loss[index])}
+    
+    def __iter__(self):
+        for index in range(self._size):
+            yield self[index]
 
 class ModelTrainer:
     """Handles model training with proper naming conventions."""
     
     def __init__(self, model_config):
         self.model_config = model_config
-        self.training_history = []
+        self.training_history = TrainingHistory()
         self.current_epoch = 0
         
         # Private methods and attributes
@@ -112,11 +283,7 @@ class ModelTrainer:
         validation_loss = self._validate_model(validation_data)
         
         self.current_epoch += 1
-        self.training_history.append({
-            'epoch': self.current_epoch,
-            'train_loss': epoch_loss,
-            'val_loss': validation_loss
-        })
+        self.training_history.append(self.current_epoch, epoch_loss, validation_loss)
         
         return epoch_loss, validation_loss
     
@@ -7,6 +7,8 @@ This script demonstrates LEGB rule and namespace concepts covered in the video l
 with practical MLOps examples showing why scope matters in ML pipelines.
 """
 
+from collections import deque
+
 # ============================================================================
 # GLOBAL SCOPE - Module-level variables (avoid mutation in production)
 # ============================================================================
@@ -19,6 +21,17 @@ counter = 0  # Global variable (avoid modifying in functions)
 CHECKPOINT_DIR = "/models/checkpoints"
 MAX_RETRIES = 3
 
+# Metric history limits for ExperimentTracker (points per metric)
+DEFAULT_RAW_WINDOW = 1000                       # Most recent points kept exactly
+DEFAULT_ROLLUP_TIERS = ((10, 1000), (100, 1000))  # (points per bucket, buckets kept)
+
+# Metric monitoring defaults (see MetricMonitor)
+DEFAULT_PATIENCE = 10            # Updates without improvement before stopping
+DEFAULT_EMA_DECAY = 0.9          # Weight of the previous EMA value
+DEFAULT_MONITOR_WINDOW = 10      # Updates in the windowed mean
+DEFAULT_PLATEAU_TOLERANCE = 1e-3 # Relative change of the windowed mean counted as flat
+MAXIMIZED_METRICS = {"accuracy", "f1", "precision", "recall", "auc"}
+
 
 # ============================================================================
 # LEGB RULE DEMONSTRATION - Local, Enclosing, Global, Built-in
@@ -135,22 +148,22 @@ def demonstrate_nonlocal_keyword():
         """Factory function that creates a trainer with internal state."""
         # This variable is in ENCLOSING scope
         training_step = 0
-        best_loss = float('inf')
+        loss_monitor = MetricMonitor(mode="min")  # Best loss, EMA, patience
         
         def train_epoch(current_loss):
             """Inner function that modifies enclosing scope variables."""
-            nonlocal training_step, best_loss  # Access enclosing scope
+            nonlocal training_step  # Rebinding needs nonlocal; mutating loss_monitor does not
             
             training_step += 1
-            if current_loss < best_loss:
-                best_loss = current_loss
-                print(f"New best loss: {best_loss} at step {training_step}")
+            if loss_monitor.update(current_loss):
+                print(f"New best loss: {loss_monitor.best} at step {training_step}")
             else:
                 print(f"Step {training_step}, loss: {current_loss}")
         
         def get_stats():
             """Another inner function accessing enclosing scope."""
-            return {"step": training_step, "best_loss": best_loss}
+            return {"step": training_step, "best_loss": loss_monitor.best,
+                    "should_stop": loss_monitor.should_stop}
         
         return train_epoch, get_stats
     
@@ -165,6 +178,189 @@ def demonstrate_nonlocal_keyword():
     print(f"Final stats: {stats_fn()}")
 
 
+# ============================================================================
+# METRIC ROLLUPS - Bounded-memory history for long training runs
+# ============================================================================
+
+class RollupSeries:
+    """History of one metric: recent raw points plus coarser rollup tiers.
+
+    The newest raw_window points are kept as (step, value). Older points
+    are compacted into buckets of {start, end, count, mean, min, max}:
+    each tier in tiers is (points per bucket, buckets kept), and buckets
+    leaving a full tier are merged into the next one. When the last tier
+    is full its buckets are merged pairwise, halving its resolution, so
+    the whole run stays covered in bounded memory.
+    """
+
+    def __init__(self, raw_window=DEFAULT_RAW_WINDOW, tiers=DEFAULT_ROLLUP_TIERS):
+        self.raw_window = raw_window
+        self.resolutions = [points for points, _ in tiers]
+        self.capacities = [buckets for _, buckets in tiers]
+        self.raw = deque()
+        self.tiers = [deque() for _ in tiers]
+        self._filling = [None] * len(tiers)  # Partially filled bucket per tier
+        self.count = 0
+        self.last = None
+
+    def append(self, value, step=None):
+        """Add a point; step defaults to the number of points seen so far."""
+        step = self.count if step is None else step
+        self.count += 1
+        self.last = value
+        self.raw.append((step, value))
+        if len(self.raw) > self.raw_window:
+            old_step, old_value = self.raw.popleft()
+            self._rollup(0, [old_step, old_step, 1, old_value, old_value, old_value])
+
+    @staticmethod
+    def _merge(bucket, other):
+        """Merge other into bucket; layout: [start, end, count, total, min, max]."""
+        bucket[1] = other[1]
+        bucket[2] += other[2]
+        bucket[3] += other[3]
+        bucket[4] = min(bucket[4], other[4])
+        bucket[5] = max(bucket[5], other[5])
+
+    def _rollup(self, level, bucket):
+        if level == len(self.tiers):
+            return  # No tiers configured: history beyond the raw window is dropped
+        filling = self._filling[level]
+        if filling is None:
+            filling = self._filling[level] = list(bucket)
+        else:
+            self._merge(filling, bucket)
+        if filling[2] < self.resolutions[level]:
+            return
+        self._filling[level] = None
+        tier = self.tiers[level]
+        tier.append(filling)
+        if len(tier) <= self.capacities[level]:
+            return
+        if level + 1 < len(self.tiers):
+            self._rollup(level + 1, tier.popleft())
+        else:
+            self._coarsen(level)
+
+    def _coarsen(self, level):
+        """Merge adjacent buckets of the last tier, doubling its resolution."""
+        buckets = list(self.tiers[level])
+        merged = deque()
+        for index in range(0, len(buckets) - 1, 2):
+            self._merge(buckets[index], buckets[index + 1])
+            merged.append(buckets[index])
+        if len(buckets) % 2:
+            merged.append(buckets[-1])
+        self.tiers[level] = merged
+        self.resolutions[level] *= 2
+
+    def points(self):
+        """Full history, oldest first: rollup buckets as dicts, then raw points."""
+        history = []
+        for level in reversed(range(len(self.tiers))):
+            pending = [self._filling[level]] if self._filling[level] else []
+            for start, end, count, total, low, high in list(self.tiers[level]) + pending:
+                history.append({"start": start, "end": end, "count": count,
+                                "mean": total / count, "min": low, "max": high})
+        history.extend({"step": step, "value": value} for step, value in self.raw)
+        return history
+
+    def __len__(self):
+        """Stored entries (raw points plus buckets), bounded by the configuration."""
+        return (len(self.raw) + sum(len(tier) for tier in self.tiers)
+                + sum(1 for bucket in self._filling if bucket))
+        # MLOps use: week-long training curves without unbounded tracker memory
+
+
+# ============================================================================
+# METRIC MONITORING - Best value, moving averages and early stopping in O(1)
+# ============================================================================
+
+class MetricMonitor:
+    """Incremental statistics for one metric, updated in O(1) per value.
+
+    Tracks the best value (mode "min" or "max", improvements must beat it
+    by min_delta), updates since the best (patience), an exponential
+    moving average and a windowed mean kept as a deque plus running sum.
+    Every `window` updates the windowed mean is compared with the one a
+    window earlier; a relative change within plateau_tolerance marks a
+    plateau.
+    """
+
+    def __init__(self, mode="min", patience=DEFAULT_PATIENCE, min_delta=0.0,
+                 ema_decay=DEFAULT_EMA_DECAY, window=DEFAULT_MONITOR_WINDOW,
+                 plateau_tolerance=DEFAULT_PLATEAU_TOLERANCE):
+        if mode not in ("min", "max"):
+            raise ValueError("mode must be 'min' or 'max'")
+        self.mode = mode
+        self.patience = patience
+        self.min_delta = min_delta
+        self.ema_decay = ema_decay
+        self.plateau_tolerance = plateau_tolerance
+        self.best = float('inf') if mode == "min" else float('-inf')
+        self.best_step = None
+        self.steps_since_best = 0
+        self.count = 0
+        self.last = None
+        self.ema = None
+        self.plateaued = False
+        self._window = deque(maxlen=window)
+        self._window_sum = 0.0
+        self._previous_window_mean = None
+
+    def update(self, value):
+        """Add a value; returns True if it is a new best."""
+        self.count += 1
+        self.last = value
+        if self.mode == "min":
+            improved = value < self.best - self.min_delta
+        else:
+            improved = value > self.best + self.min_delta
+        if improved:
+            self.best = value
+            self.best_step = self.count
+            self.steps_since_best = 0
+        else:
+            self.steps_since_best += 1
+        
+        if self.ema is None:
+            self.ema = value
+        else:
+            self.ema = self.ema_decay * self.ema + (1 - self.ema_decay) * value
+        
+        if len(self._window) == self._window.maxlen:
+            self._window_sum -= self._window[0]  # Value about to fall out of the window
+        self._window.append(value)
+        self._window_sum += value
+        if self.count % self._window.maxlen == 0:
+            self._check_plateau()
+        return improved
+
+    def _check_plateau(self):
+        current = self.window_mean
+        previous = self._previous_window_mean
+        if previous is not None:
+            scale = max(abs(previous), 1e-12)
+            self.plateaued = abs(current - previous) / scale <= self.plateau_tolerance
+        self._previous_window_mean = current
+
+    @property
+    def window_mean(self):
+        return self._window_sum / len(self._window) if self._window else None
+
+    @property
+    def should_stop(self):
+        """True once patience updates have passed without improvement."""
+        return self.steps_since_best >= self.patience
+
+    def summary(self):
+        return {"best": self.best, "best_step": self.best_step, "last": self.last,
+                "ema": self.ema, "window_mean": self.window_mean,
+                "steps_since_best": self.steps_since_best,
+                "should_stop": self.should_stop, "plateaued": self.plateaued}
+        # MLOps use: early stopping and LR-on-plateau for dozens of metrics per step
+
+
 # ============================================================================
 # MLOPS BEST PRACTICES - Avoiding scope problems
 # ============================================================================
@@ -184,21 +380,36 @@ def mlops_scope_best_practices():
     class ExperimentTracker:
         """Better alternative to global variables."""
         
-        def __init__(self):
-            self.metrics = []
-            self.best_score = 0.0
+        def __init__(self, raw_window=DEFAULT_RAW_WINDOW, tiers=DEFAULT_ROLLUP_TIERS):
+            self.metrics = {}  # Metric name -> RollupSeries (bounded memory)
+            self.monitors = {}  # Metric name -> MetricMonitor (best, EMA, patience)
+            self.raw_window = raw_window
+            self.tiers = tiers
         
-        def log_metric(self, metric_name, value):
+        @property
+        def best_score(self):
+            monitor = self.monitors.get("accuracy")
+            return monitor.best if monitor else 0.0
+        
+        def log_metric(self, metric_name, value, step=None):
             """Log metrics without global state."""
-            self.metrics.append({"name": metric_name, "value": value})
-            if metric_name == "accuracy" and value > self.best_score:
-                self.best_score = value
+            series = self.metrics.get(metric_name)
+            if series is None:
+                series = self.metrics[metric_name] = RollupSeries(self.raw_window, self.tiers)
+                mode = "max" if metric_name in MAXIMIZED_METRICS else "min"
+                self.monitors[metric_name] = MetricMonitor(mode=mode)
+            series.append(value, step)
+            if self.monitors[metric_name].update(value) and metric_name == "accuracy":
                 print(f"New best accuracy: {value}")
         
+        def history(self, metric_name):
+            """Raw recent points and older rollup buckets for one metric."""
+            return self.metrics[metric_name].points()
+        
         def get_summary(self):
             """Get experiment summary."""
             return {
-                "total_metrics": len(self.metrics),
+                "total_metrics": sum(series.count for series in self.metrics.values()),
                 "best_score": self.best_score
             }
     
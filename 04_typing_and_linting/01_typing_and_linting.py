@@ -39,11 +39,40 @@ def add(a: int, b: int) -> int:
 # COMPLEX TYPE HINTS - Collections and imports
 # ============================================================================
 
-from typing import List
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional
 
-def load_files(paths: List[str]) -> List[str]:
-    """Function with complex type hints for collections."""
-    ...  # Placeholder implementation
+def read_text(path: str) -> str:
+    """Read one file - I/O-bound, the GIL is released while waiting on disk."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def load_files(
+    paths: List[str],
+    max_workers: Optional[int] = None,
+    parser: Callable[[str], str] = read_text,
+    use_processes: bool = False,
+) -> List[str]:
+    """Function with complex type hints for collections.
+
+    Loads many files concurrently. Threads overlap open/read latency for
+    I/O-bound formats; use_processes=True runs a CPU-bound parser on a
+    process pool instead (parser must then be a module-level function).
+    Results are returned in the same order as paths.
+    """
+    if not paths:
+        return []
+    if max_workers is None:
+        per_cpu = 1 if use_processes else 4  # Threads mostly wait, so oversubscribe
+        max_workers = min(32, len(paths), (os.cpu_count() or 1) * per_cpu)
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    executor: Executor
+    with executor_class(max_workers=max_workers) as executor:
+        # map() yields results in input order regardless of completion order;
+        # chunksize batches small shards per process round-trip
+        chunksize = max(1, len(paths) // (max_workers * 4))
+        return list(executor.map(parser, paths, chunksize=chunksize))
     # Type hints: paths is list of strings, returns list of strings
     # MLOps use: data loading, file processing, batch operations
 
@@ -57,4 +86,14 @@ print( x )    # Extra spaces inside parentheses
 # MLOps impact: inconsistent code style hurts team collaboration
 # Solution: use tools like flake8, black, pylint for consistent formatting
 
-
+if __name__ == "__main__":  # Guard needed: process pools may re-import this module
+    import tempfile
+    with tempfile.TemporaryDirectory() as shard_dir:
+        shard_paths = []
+        for shard_index in range(8):
+            shard_path = os.path.join(shard_dir, f"shard_{shard_index:03d}.txt")
+            with open(shard_path, "w", encoding="utf-8") as f:
+                f.write(f"shard {shard_index}")
+            shard_paths.append(shard_path)
+        print(load_files(shard_paths, max_workers=4))                      # Thread pool
+        print(load_files(shard_paths, max_workers=2, use_processes=True))  # Process pool
@@ -0,0 +1,216 @@
+#!/usr/bin/python3
+
+"""
+log_index.py - On-disk Inverted Log Index Module
+
+Direct lookups into large log archives:
+- Maps run IDs and error codes to (file, byte offset, minute) postings
+- Maps each minute to the first line logged in it, per file
+- Stored in SQLite; updated incrementally as logs are appended
+- Lookups seek straight to the matching lines instead of rescanning
+
+Example:
+    with LogIndex("logs.idx.sqlite") as index:
+        index.update(["train.log"])
+        for path, offset, line in index.read_lines("run_20250101_153045",
+                                                   "2025-01-01 15:00", "2025-01-01 15:10"):
+            print(line)
+"""
+
+import calendar
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+# ============================================================================
+# DEFAULTS - Indexed terms and timestamp format
+# ============================================================================
+
+DEFAULT_TERM_PATTERNS = {
+    "run": rb"run_\d{8}_\d{6}",              # run_20250101_153045
+    "error": rb"\b(?:ERR|E)[-_]?\d{3,5}\b",  # E1234, ERR-042
+}
+# Line timestamp; lines without one (tracebacks) inherit the previous minute
+TIMESTAMP_PATTERN = rb"(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2})"
+DEFAULT_READ_BYTES = 16 * 1024 * 1024  # Bytes indexed per batch/transaction
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    inode INTEGER NOT NULL,
+    indexed_bytes INTEGER NOT NULL,  -- Everything before this offset is indexed
+    last_minute INTEGER              -- Minute of the last indexed line
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    file_id INTEGER NOT NULL,
+    offset INTEGER NOT NULL,         -- Byte offset of the line start
+    minute INTEGER                   -- Minutes since the epoch (UTC), NULL if unknown
+);
+CREATE INDEX IF NOT EXISTS postings_term ON postings (term, minute);
+CREATE TABLE IF NOT EXISTS minutes (
+    file_id INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    offset INTEGER NOT NULL,         -- First line of this minute in the file
+    PRIMARY KEY (file_id, minute)
+);
+"""
+
+
+def to_minute(value):
+    """Minutes since the epoch for a datetime, "YYYY-MM-DD HH:MM" string or int.
+
+    Naive values are taken as UTC, like the log timestamps; aware values
+    are converted to UTC first.
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.utcoffset() is not None:
+        return calendar.timegm(value.utctimetuple()) // 60
+    return calendar.timegm(value.timetuple()) // 60
+
+# ============================================================================
+# LOG INDEX - SQLite postings with incremental updates
+# ============================================================================
+
+class LogIndex:
+    """Inverted index from log terms and minutes to byte offsets.
+
+    update() indexes only bytes appended since the last call, up to the
+    last complete line. A file whose inode changed (rotated) or that got
+    smaller (truncated) is re-indexed from the start.
+    """
+
+    def __init__(self, db_path, term_patterns=DEFAULT_TERM_PATTERNS):
+        self.db_path = db_path
+        self._term_pattern = re.compile(b"|".join(term_patterns.values()))
+        self._timestamp_pattern = re.compile(TIMESTAMP_PATTERN)
+        self._minute_cache = {}  # Timestamp bytes -> minute
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(_SCHEMA)
+
+    def _line_minute(self, line):
+        match = self._timestamp_pattern.search(line, 0, 40)  # Timestamps lead the line
+        if match is None:
+            return None
+        key = match.group()
+        minute = self._minute_cache.get(key)
+        if minute is None:
+            year, month, day, hour, mins = map(int, match.groups())
+            minute = calendar.timegm((year, month, day, hour, mins, 0)) // 60
+            self._minute_cache[key] = minute
+        return minute
+
+    def _file_state(self, path):
+        """(file_id, start offset, last minute) for indexing path, resetting if rotated."""
+        stat = os.stat(path)
+        row = self.connection.execute(
+            "SELECT file_id, inode, indexed_bytes, last_minute FROM files WHERE path = ?",
+            (path,)).fetchone()
+        if row is None:
+            cursor = self.connection.execute(
+                "INSERT INTO files (path, inode, indexed_bytes) VALUES (?, ?, 0)", (path, stat.st_ino))
+            return cursor.lastrowid, 0, None
+        file_id, inode, indexed_bytes, last_minute = row
+        if inode != stat.st_ino or stat.st_size < indexed_bytes:
+            self.connection.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+            self.connection.execute("DELETE FROM minutes WHERE file_id = ?", (file_id,))
+            self.connection.execute(
+                "UPDATE files SET inode = ?, indexed_bytes = 0, last_minute = NULL WHERE file_id = ?",
+                (stat.st_ino, file_id))
+            return file_id, 0, None
+        return file_id, indexed_bytes, last_minute
+
+    def update(self, paths, read_bytes=DEFAULT_READ_BYTES):
+        """Index new complete lines of each file; returns the number of lines indexed."""
+        indexed_lines = 0
+        for path in paths:
+            path = os.path.abspath(path)
+            with self.connection:
+                file_id, offset, minute = self._file_state(path)
+            with open(path, "rb") as log_file:
+                log_file.seek(offset)
+                block_bytes = read_bytes
+                while True:
+                    block = log_file.read(block_bytes)
+                    end = block.rfind(b"\n") + 1
+                    if end == 0 and len(block) == block_bytes:
+                        block_bytes *= 2  # A line longer than the block: read more
+                        log_file.seek(offset)
+                        continue
+                    if end == 0:
+                        break  # Nothing new, or only a partial last line
+                    postings, minutes = [], []
+                    line_offset = offset
+                    for line in block[:end - 1].split(b"\n"):
+                        line_minute = self._line_minute(line)
+                        if line_minute is not None and line_minute != minute:
+                            minute = line_minute
+                            minutes.append((file_id, minute, line_offset))
+                        terms = {match.group(0) for match in self._term_pattern.finditer(line)}
+                        for term in terms:  # group(0): patterns may contain capturing groups
+                            postings.append((term.decode("utf-8"), file_id, line_offset, minute))
+                        line_offset += len(line) + 1  # Plus the newline
+                        indexed_lines += 1
+                    offset += end
+                    with self.connection:  # One transaction per block
+                        self.connection.executemany(
+                            "INSERT INTO postings VALUES (?, ?, ?, ?)", postings)
+                        self.connection.executemany(
+                            "INSERT OR IGNORE INTO minutes VALUES (?, ?, ?)", minutes)
+                        self.connection.execute(
+                            "UPDATE files SET indexed_bytes = ?, last_minute = ? WHERE file_id = ?",
+                            (offset, minute, file_id))
+                    log_file.seek(offset)  # Re-read the partial last line next time
+        return indexed_lines
+
+    def lookup(self, term, start=None, end=None):
+        """(path, offset) of lines containing term, logged in [start, end] minutes."""
+        query = ("SELECT files.path, postings.offset FROM postings "
+                 "JOIN files USING (file_id) WHERE postings.term = ?")
+        params = [term]
+        if start is not None:
+            query += " AND postings.minute >= ?"
+            params.append(to_minute(start))
+        if end is not None:
+            query += " AND postings.minute <= ?"
+            params.append(to_minute(end))
+        query += " ORDER BY files.path, postings.offset"
+        return self.connection.execute(query, params).fetchall()
+
+    def first_offset(self, path, start):
+        """Offset of the first line logged at or after start in path, or None."""
+        row = self.connection.execute(
+            "SELECT MIN(minutes.offset) FROM minutes JOIN files USING (file_id) "
+            "WHERE files.path = ? AND minutes.minute >= ?",
+            (os.path.abspath(path), to_minute(start))).fetchone()
+        return row[0]
+
+    def read_lines(self, term, start=None, end=None, encoding="utf-8"):
+        """Yield (path, offset, line) for each match, seeking straight to it."""
+        open_path, log_file = None, None
+        try:
+            for path, offset in self.lookup(term, start, end):
+                if path != open_path:
+                    if log_file is not None:
+                        log_file.close()
+                    open_path, log_file = path, open(path, "rb")
+                log_file.seek(offset)
+                yield path, offset, log_file.readline().rstrip(b"\r\n").decode(encoding, errors="replace")
+        finally:
+            if log_file is not None:
+                log_file.close()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        # MLOps use: incident lookups by run ID and time window without rescanning logs
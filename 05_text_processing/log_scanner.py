@@ -0,0 +1,200 @@
+#!/usr/bin/python3
+
+"""
+log_scanner.py - Multi-pattern Log Scanning Module
+
+Single-pass matching of many log signatures:
+- Compiles all signatures into one regex (a prefix trie for keywords)
+- Counts or classifies every line in one pass over the text
+- Streams large files in line-aligned blocks with bounded memory
+- Can be imported by the numbered examples and by alerting jobs
+"""
+
+import os
+import re
+from collections import Counter
+from itertools import groupby
+
+# ============================================================================
+# DEFAULTS - Block size for file scanning
+# ============================================================================
+
+DEFAULT_BLOCK_BYTES = 4 * 1024 * 1024  # Approximate text scanned per regex call
+DEFAULT_ENCODING = "utf-8"
+
+# ============================================================================
+# TRIE REGEX - Shared prefixes factored out of a keyword alternation
+# ============================================================================
+
+def _trie_pattern(keywords):
+    """Regex matching any keyword, shaped like a prefix trie of the keywords.
+
+    Each branch consumes the longest prefix shared by its keywords, so
+    recursion depth follows the number of branch points, not keyword length.
+    """
+    suffixes = sorted(set(keywords))
+    branches = []
+    for _, group in groupby((suffix for suffix in suffixes if suffix), key=lambda suffix: suffix[0]):
+        group = list(group)
+        prefix = os.path.commonprefix(group)
+        branches.append(re.escape(prefix) + _trie_pattern([word[len(prefix):] for word in group]))
+    if not branches:
+        return ""
+    if "" not in suffixes:
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return "(?:" + "|".join(branches) + ")?"  # Greedy: longer keyword first
+
+
+# ============================================================================
+# LOG SCANNER - One compiled automaton for every signature
+# ============================================================================
+
+class LogScanner:
+    """Match a set of signatures against log text in a single pass.
+
+    signatures is a dict of name -> pattern, or an iterable of keywords
+    (each keyword is its own name). With literal=True patterns are plain
+    keywords; otherwise they are regular expressions.
+
+    Literal keywords are compiled into one trie-shaped regex, e.g.
+    "ERROR", "ERR", "EPOCH" -> E(?:RR(?:OR)?|POCH), so at each position
+    the regex engine follows a single branch instead of trying every
+    keyword. The trie runs inside a lookahead, so every start position
+    is tried, and the keywords matching at a position are the longest
+    match and the keywords that are its prefixes (precomputed). Every
+    occurrence of every keyword is therefore reported, including ones
+    overlapping or inside other keywords ("error" in "CUDA error"); a
+    keyword overlapping itself ("aa" in "aaa") counts once per start.
+
+    Regular expressions are combined as (?P<s0>...)|(?P<s1>...)|... and
+    identified by match.lastgroup, which costs one attempt per pattern at
+    each position. Their matches are leftmost and non-overlapping, so a
+    pattern matching inside another pattern's match is not reported.
+
+    Example:
+        scanner = LogScanner({"oom": "CUDA out of memory", "nan": "loss=nan"})
+        counts = scanner.scan_file("train.log")
+    """
+
+    def __init__(self, signatures, ignore_case=False, literal=True):
+        if not isinstance(signatures, dict):
+            signatures = {keyword: keyword for keyword in signatures}
+        if not signatures:
+            raise ValueError("LogScanner needs at least one signature")
+        self.signatures = dict(signatures)
+        self.ignore_case = ignore_case
+        flags = re.IGNORECASE if ignore_case else 0
+        if literal:
+            keywords = {}  # Keyword (lowercased if ignore_case) -> signature name
+            for name, keyword in self.signatures.items():
+                if not keyword:
+                    raise ValueError(f"Signature {name!r} is empty")
+                key = keyword.lower() if ignore_case else keyword
+                if key in keywords:
+                    raise ValueError(f"Signatures {keywords[key]!r} and {name!r} have the same keyword {keyword!r}")
+                keywords[key] = name
+            # Longest match at a position -> every signature matching there
+            self._key_names = {key: [keywords[key[:length]] for length in range(1, len(key) + 1)
+                                     if key[:length] in keywords]
+                               for key in keywords}
+            self._case_aliases = {}  # Matched text whose lower() is not a key -> key
+            self.pattern = re.compile(f"(?=({_trie_pattern(keywords)}))", flags)
+            self._match_key = self._keyword_key
+        else:
+            self._key_names = {}  # Regex group name -> [signature name]
+            alternatives = []
+            for index, (name, pattern) in enumerate(self.signatures.items()):
+                group = f"s{index}"  # Signature names need not be valid identifiers
+                self._key_names[group] = [name]
+                alternatives.append(f"(?P<{group}>{pattern})")
+            self.pattern = re.compile("|".join(alternatives), flags)
+            self._match_key = self._group_key
+
+    def _keyword_key(self, match):
+        text = match.group(1)
+        if not self.ignore_case:
+            return text
+        key = text.lower()
+        return key if key in self._key_names else self._case_alias(text)
+
+    def _case_alias(self, text):
+        """Key for a case-insensitive match that lower() does not map back.
+
+        re.IGNORECASE also equates characters such as "ſ" with "s" and
+        "K" (Kelvin sign) with "k", whose lower() differs from the keyword.
+        """
+        key = self._case_aliases.get(text)
+        if key is None:
+            key = next(key for key in self._key_names
+                       if re.fullmatch(re.escape(key), text, re.IGNORECASE))
+            self._case_aliases[text] = key
+        return key
+
+    @staticmethod
+    def _group_key(match):
+        return match.lastgroup
+
+    def count(self, text):
+        """Occurrences of each signature in text."""
+        counts = Counter()
+        for key, occurrences in Counter(map(self._match_key, self.pattern.finditer(text))).items():
+            for name in self._key_names[key]:
+                counts[name] += occurrences
+        return counts
+
+    def classify(self, line):
+        """Name of the first (leftmost, then longest) signature in line, or None."""
+        match = self.pattern.search(line)
+        return self._key_names[self._match_key(match)][-1] if match else None
+
+    def scan_text(self, text, first_line=1):
+        """Yield (line_number, line, signature names) for lines with matches.
+
+        Scans the whole text with one finditer() call and maps match
+        offsets to lines, instead of running the regex line by line.
+        """
+        match_key, key_names = self._match_key, self._key_names
+        line_number = first_line
+        counted_to = 0      # Newlines before this offset are already counted
+        line_start = line_end = -1
+        names = None
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            if names is not None and start < line_end:
+                names.extend(key_names[match_key(match)])  # Another match on the same line
+                continue
+            if names is not None:
+                yield line_number, text[line_start:line_end], names
+            line_number += text.count("\n", counted_to, start)
+            counted_to = start
+            line_start = text.rfind("\n", 0, start) + 1
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = len(text)
+            names = list(key_names[match_key(match)])
+        if names is not None:
+            yield line_number, text[line_start:line_end], names
+
+    def iter_blocks(self, path, block_bytes=DEFAULT_BLOCK_BYTES, encoding=DEFAULT_ENCODING):
+        """Yield (first line number, text) blocks made of whole lines."""
+        line_number = 1
+        with open(path, "r", encoding=encoding, errors="replace") as log_file:
+            while True:
+                lines = log_file.readlines(block_bytes)  # Stops at a line boundary
+                if not lines:
+                    return
+                yield line_number, "".join(lines)
+                line_number += len(lines)
+
+    def scan_file(self, path, block_bytes=DEFAULT_BLOCK_BYTES, encoding=DEFAULT_ENCODING):
+        """Signature counts for a whole file, read once in line-aligned blocks."""
+        counts = Counter()
+        for _, text in self.iter_blocks(path, block_bytes, encoding):
+            counts.update(self.count(text))
+        return counts
+
+    def matching_lines(self, path, block_bytes=DEFAULT_BLOCK_BYTES, encoding=DEFAULT_ENCODING):
+        """Yield (line_number, line, signature names) for every matching line of a file."""
+        for first_line, text in self.iter_blocks(path, block_bytes, encoding):
+            yield from self.scan_text(text, first_line)
+        # MLOps use: alerting on hundreds of error signatures in one pass over the logs
@@ -0,0 +1,167 @@
+#!/usr/bin/python3
+
+"""
+metric_parser.py - Compiled Metric Line Parser Module
+
+Turns metric log lines into typed NumPy columns:
+- Declarative line schema: template plus a dtype per field
+- Schema compiled once into a bytes regex
+- Whole blocks parsed with one findall(), numbers converted per column by NumPy
+- Streams files in fixed-size batches of rows (no Python float per value)
+
+Example:
+    parser = MetricLineParser("epoch={epoch}, loss={loss}",
+                              {"epoch": "int32", "loss": "float32"})
+    columns = parser.parse_file("train.log")   # {"epoch": array, "loss": array}
+    df = pandas.DataFrame(columns)
+"""
+
+import re
+import string
+
+import numpy as np
+
+# ============================================================================
+# DEFAULTS - Block and batch sizes
+# ============================================================================
+
+DEFAULT_BLOCK_BYTES = 8 * 1024 * 1024  # Bytes read and parsed at a time
+DEFAULT_BATCH_ROWS = 1_000_000         # Rows per yielded batch
+
+# Regex for each NumPy dtype kind
+_FIELD_PATTERNS = {
+    "i": rb"-?\d+",
+    "u": rb"\d+",
+    "f": rb"[-+]?(?:\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?|nan|NaN|inf|Inf)",
+    "S": rb"\S+",
+}
+
+# ============================================================================
+# METRIC LINE PARSER - Schema compiled once, applied to whole blocks
+# ============================================================================
+
+class MetricLineParser:
+    """Parse log lines matching a template into typed column arrays.
+
+    template marks fields as {name}; all other text must match literally.
+    dtypes maps every field to a NumPy integer, float or bytes dtype.
+    Lines that do not match the template are skipped.
+
+    A block of lines is matched with a single regex findall(); each
+    column's matched bytes are joined and parsed by np.fromstring(), so
+    values are never Python ints or floats.
+    """
+
+    def __init__(self, template, dtypes):
+        self.template = template
+        self.fields = []
+        parts = []
+        for literal, field, _, _ in string.Formatter().parse(template):
+            parts.append(re.escape(literal.encode("utf-8")))
+            if field is None:
+                continue
+            if field not in dtypes:
+                raise ValueError(f"No dtype given for field '{field}'")
+            kind = np.dtype(dtypes[field]).kind
+            if kind not in _FIELD_PATTERNS:
+                raise ValueError(f"Unsupported dtype for field '{field}': {dtypes[field]}")
+            self.fields.append(field)
+            parts.append(b"(" + _FIELD_PATTERNS[kind] + b")")
+        if not self.fields:
+            raise ValueError("Template has no {field} placeholders")
+        self.dtypes = {field: np.dtype(dtypes[field]) for field in self.fields}
+        self.pattern = re.compile(b"".join(parts))
+
+    def _empty(self):
+        return {field: np.empty(0, dtype=self.dtypes[field]) for field in self.fields}
+
+    def parse_bytes(self, data):
+        """Columns for every match in a bytes block."""
+        matches = self.pattern.findall(data)
+        if not matches:
+            return self._empty()
+        if len(self.fields) == 1:
+            return {self.fields[0]: self._column(matches, self.dtypes[self.fields[0]])}
+        return {field: self._column([match[index] for match in matches], self.dtypes[field])
+                for index, field in enumerate(self.fields)}
+
+    @staticmethod
+    def _column(values, dtype):
+        """Matched bytes of one field -> typed array, parsed in C by NumPy."""
+        if dtype.kind == "S":
+            return np.array(values, dtype=dtype)
+        if dtype.kind in "iu":
+            return MetricLineParser._integer_column(values, dtype)
+        column = np.fromstring(b" ".join(values), dtype=dtype, sep=" ")
+        if len(column) != len(values):
+            raise ValueError(f"Could not parse every value as {dtype}")
+        return column
+
+    @staticmethod
+    def _integer_column(values, dtype):
+        """Parse at 64 bits, then range-check before casting down.
+
+        np.fromstring wraps narrow integers (300 as int8 -> 44) and
+        saturates at the 64-bit limits, so values at those limits are
+        re-checked with Python ints and everything is compared with the
+        target dtype's range.
+        """
+        wide = np.dtype(np.uint64) if dtype == np.uint64 else np.dtype(np.int64)
+        column = np.fromstring(b" ".join(values), dtype=wide, sep=" ")
+        if len(column) != len(values):
+            raise ValueError(f"Could not parse every value as {dtype}")
+        wide_info, info = np.iinfo(wide), np.iinfo(dtype)
+        for index in np.flatnonzero((column == wide_info.max) | (column == wide_info.min)):
+            if int(values[index]) != int(column[index]):  # Saturated: out of 64-bit range
+                raise ValueError(f"Value {values[index].decode()} is out of range for {dtype}")
+        if column.min() < info.min or column.max() > info.max:
+            bad = column[(column < info.min) | (column > info.max)][0]
+            raise ValueError(f"Value {bad} is out of range for {dtype}")
+        return column.astype(dtype)
+
+    def iter_blocks(self, path, block_bytes=DEFAULT_BLOCK_BYTES):
+        """Yield columns for each block of whole lines read from path."""
+        with open(path, "rb") as log_file:
+            remainder = b""
+            while True:
+                chunk = log_file.read(block_bytes)
+                if not chunk:
+                    break
+                data = remainder + chunk
+                last_newline = data.rfind(b"\n")
+                if last_newline == -1:
+                    remainder = data  # Line longer than a block: keep reading
+                    continue
+                remainder = data[last_newline + 1:]
+                yield self.parse_bytes(data[:last_newline + 1])
+            if remainder:
+                yield self.parse_bytes(remainder)  # Last line without a newline
+
+    def iter_batches(self, path, batch_rows=DEFAULT_BATCH_ROWS, block_bytes=DEFAULT_BLOCK_BYTES):
+        """Yield column dicts of exactly batch_rows rows (the last may be shorter)."""
+        pending = []
+        pending_rows = 0
+        for columns in self.iter_blocks(path, block_bytes):
+            rows = len(columns[self.fields[0]])
+            if rows == 0:
+                continue
+            pending.append(columns)
+            pending_rows += rows
+            while pending_rows >= batch_rows:
+                merged = self._concat(pending)
+                yield {field: values[:batch_rows] for field, values in merged.items()}
+                pending = [{field: values[batch_rows:] for field, values in merged.items()}]
+                pending_rows -= batch_rows
+        if pending_rows:
+            yield self._concat(pending)
+
+    def _concat(self, parts):
+        if len(parts) == 1:
+            return parts[0]
+        return {field: np.concatenate([part[field] for part in parts]) for field in self.fields}
+
+    def parse_file(self, path, block_bytes=DEFAULT_BLOCK_BYTES):
+        """All columns of a file as one dict of arrays."""
+        parts = list(self.iter_blocks(path, block_bytes))
+        return self._concat(parts) if parts else self._empty()
+        # MLOps use: load a 10M-step training log into a DataFrame in seconds
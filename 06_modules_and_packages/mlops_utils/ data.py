@@ -1,21 +0,0 @@
-#!/usr/bin/python3
-
-"""
-mlops_utils/data.py - Data Processing Module
-
-Part of mlops_utils package:
-- Contains data-related functions
-- Focused on data preprocessing and loading
-- Can be imported individually or through package
-"""
-
-def preprocess(data):
-    """Preprocess raw data for ML training."""
-    ...  # Placeholder for data preprocessing logic
-    # MLOps use: data cleaning, feature engineering, normalization
-
-def load_data(path):
-    """Load data from specified file path."""
-    print(f"Loading dataset from {path}")
-    # MLOps use: data loading from various sources (CSV, JSON, databases)
-
@@ -11,6 +11,8 @@ Makes mlops_utils a Python package:
 
 # Import functions from submodules to make them available at package level
 from .data import preprocess      # Import preprocess from data.py
+from .data import load_data       # Import load_data from data.py
+from .data import Preprocessor    # Import Preprocessor from data.py
 from .logging import log_metric   # Import log_metric from logging.py
 
 # Now users can do: from mlops_utils import preprocess, log_metric
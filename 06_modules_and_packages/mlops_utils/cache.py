@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+
+"""
+mlops_utils/cache.py - Dataset Cache Module
+
+Part of mlops_utils package:
+- Stores parsed datasets as columnar .npy snapshots on disk
+- Keys snapshots by source content hash plus loader options
+- Invalidates snapshots when a source file's mtime or size changes
+- Bounds total cache size with least-recently-used eviction
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# ============================================================================
+# CACHE CONFIGURATION - Defaults for location and size budget
+# ============================================================================
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "mlops_utils" / "datasets"
+DEFAULT_CACHE_BYTES = 20 * 1024 ** 3  # 20 GB of snapshots before eviction
+HASH_CHUNK_BYTES = 8 * 1024 * 1024    # Read size while hashing source files
+FINGERPRINTS_FILE = "fingerprints.json"
+META_FILE = "meta.json"
+
+# ============================================================================
+# DATASET CACHE - Content-addressed columnar snapshots with LRU eviction
+# ============================================================================
+
+class DatasetCache:
+    """On-disk cache of parsed datasets.
+
+    Each entry is a directory holding one .npy file per column and a
+    meta.json file. The content hash of a source is remembered together
+    with its mtime and size, so unchanged files are not re-hashed; when
+    either changes the file is re-hashed and its old snapshots are dropped.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._fingerprints_path = self.cache_dir / FINGERPRINTS_FILE
+
+    def _read_fingerprints(self):
+        try:
+            return json.loads(self._fingerprints_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_fingerprints(self, fingerprints):
+        tmp_path = self._fingerprints_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(fingerprints))
+        os.replace(tmp_path, self._fingerprints_path)  # Atomic swap
+
+    @staticmethod
+    def _hash_file(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def content_hash(self, path):
+        """Content hash of a source file, re-hashed only when mtime or size changes."""
+        source = str(Path(path).resolve())
+        stat = os.stat(source)
+        fingerprints = self._read_fingerprints()
+        known = fingerprints.get(source)
+        if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+            return known["sha256"]
+
+        if known:
+            for stale_key in known.get("keys", []):
+                self.invalidate(stale_key)  # Source changed - drop its snapshots
+        fingerprints[source] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                                "sha256": self._hash_file(source), "keys": []}
+        self._write_fingerprints(fingerprints)
+        return fingerprints[source]["sha256"]
+
+    def key(self, path, options=None):
+        """Cache key from the source content hash plus loader options."""
+        payload = json.dumps({"sha256": self.content_hash(path), "options": options or {}},
+                             sort_keys=True, default=str)
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+        fingerprints = self._read_fingerprints()
+        record = fingerprints.get(str(Path(path).resolve()))
+        if record is not None and key not in record["keys"]:
+            record["keys"].append(key)
+            self._write_fingerprints(fingerprints)
+        return key
+
+    def get(self, key):
+        """Return cached columns as read-only memory-mapped arrays, or None."""
+        entry_dir = self.cache_dir / key
+        meta_path = entry_dir / META_FILE
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        os.utime(meta_path)  # Mark as recently used for LRU eviction
+        return {name: np.load(entry_dir / f"{index}.npy", mmap_mode="r")
+                for index, name in enumerate(meta["columns"])}
+
+    def put(self, key, columns):
+        """Store a dict of NumPy columns under key, then enforce the size budget."""
+        entry_dir = self.cache_dir / key
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp-"))
+        try:
+            total_bytes = 0
+            for index, values in enumerate(columns.values()):
+                np.save(tmp_dir / f"{index}.npy", np.asarray(values), allow_pickle=False)
+                total_bytes += (tmp_dir / f"{index}.npy").stat().st_size
+            meta = {"columns": list(columns), "bytes": total_bytes}
+            (tmp_dir / META_FILE).write_text(json.dumps(meta))
+            os.replace(tmp_dir, entry_dir)  # Readers never see a half-written entry
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not (entry_dir / META_FILE).exists():
+                raise  # Not a lost race with another writer
+        self.evict()
+
+    def invalidate(self, key):
+        """Remove one cache entry if present."""
+        shutil.rmtree(self.cache_dir / key, ignore_errors=True)
+
+    def evict(self):
+        """Remove least-recently-used entries until the cache fits max_bytes."""
+        entries = []
+        for meta_path in self.cache_dir.glob(f"*/{META_FILE}"):
+            try:
+                size = json.loads(meta_path.read_text())["bytes"]
+                entries.append((meta_path.stat().st_mtime, size, meta_path.parent.name))
+            except (OSError, json.JSONDecodeError, KeyError):
+                continue
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):  # Oldest access first
+            if total_bytes <= self.max_bytes:
+                break
+            self.invalidate(key)
+            total_bytes -= size
+        # MLOps use: keep experiment reruns fast without filling the disk
@@ -0,0 +1,252 @@
+#!/usr/bin/python3
+
+"""
+mlops_utils/collector.py - Multi-process Metric Collector Module
+
+Part of mlops_utils package:
+- One shared-memory ring buffer per worker process
+- Workers append without locks on x86 (single producer per ring);
+  weakly ordered CPUs (ARM) use a per-ring lock as a memory barrier
+- A single aggregator drains every ring into a metric backend
+- Per-worker ordering preserved, overflow counted as dropped samples
+"""
+
+import multiprocessing
+import platform
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# ============================================================================
+# RING BUFFER LAYOUT - Header counters followed by fixed-size records
+# ============================================================================
+
+DEFAULT_CAPACITY = 65536       # Records per worker ring
+DEFAULT_DRAIN_INTERVAL_MS = 50 # Aggregator polling period
+MAX_NAME_BYTES = 48            # Metric names are stored inline, UTF-8 encoded
+
+HEAD, TAIL, DROPPED = 0, 1, 2  # Header slots (uint64 counters)
+UNPUBLISHED = np.iinfo(np.uint64).max  # seq of a slot that was never written
+# Lock-free publishing relies on stores becoming visible in program order (TSO)
+STRONGLY_ORDERED = platform.machine().lower() in {"x86_64", "amd64", "i386", "i686", "x86"}
+HEADER_DTYPE = np.dtype(("<u8", 4))
+RECORD_DTYPE = np.dtype([
+    ("seq", "<u8"),                 # Per-worker sequence number
+    ("timestamp", "<f8"),
+    ("value", "<f8"),
+    ("name", f"S{MAX_NAME_BYTES}"),
+])
+
+
+def _ring_bytes(capacity):
+    return HEADER_DTYPE.itemsize + capacity * RECORD_DTYPE.itemsize
+
+
+def _attach(name):
+    """Attach to an existing segment owned (and later unlinked) by the collector."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        # Older Pythons register the segment again; worker processes share the
+        # collector's resource tracker, so this only repeats its registration
+        return shared_memory.SharedMemory(name=name)
+
+
+def _ring_views(segment, capacity):
+    header = np.ndarray(4, dtype="<u8", buffer=segment.buf)
+    records = np.ndarray(capacity, dtype=RECORD_DTYPE, buffer=segment.buf,
+                         offset=HEADER_DTYPE.itemsize)
+    return header, records
+
+# ============================================================================
+# RING WRITER - Worker-side producer
+# ============================================================================
+
+class RingWriter:
+    """Append metrics to one worker's shared-memory ring.
+
+    Only the owning worker writes HEAD and DROPPED, only the aggregator
+    writes TAIL. A record's fields are written first and its seq field
+    last, then HEAD is advanced; the aggregator accepts a slot only if
+    its seq equals the expected sequence number. Without a lock this
+    publish order is only safe on x86 (total store order), so on weakly
+    ordered CPUs such as ARM the collector passes a per-ring lock that
+    both sides hold while touching the ring, which acts as a memory
+    barrier. When the ring is full the sample is dropped and counted
+    instead of blocking.
+
+    Writers pickle as (segment name, capacity, lock), so they can be
+    passed to multiprocessing workers with any start method (with a lock,
+    only as Process arguments), and can be used as a log_metric() backend
+    via logging.set_metric_backend().
+    """
+
+    def __init__(self, segment_name, capacity, lock=None):
+        self.segment_name = segment_name
+        self.capacity = capacity
+        self._lock = lock
+        self._segment = _attach(segment_name)
+        self._header, self._records = _ring_views(self._segment, capacity)
+        self._encoded_names = {}
+
+    def _encode(self, name):
+        encoded = self._encoded_names.get(name)
+        if encoded is None:
+            encoded = name.encode("utf-8")
+            if len(encoded) > MAX_NAME_BYTES:
+                raise ValueError(f"Metric name longer than {MAX_NAME_BYTES} bytes: {name!r}")
+            self._encoded_names[name] = encoded
+        return encoded
+
+    def record(self, name, value, timestamp=None):
+        """Append one metric; returns False if the ring was full and it was dropped."""
+        if self._lock is None:
+            return self._append(name, value, timestamp)
+        with self._lock:
+            return self._append(name, value, timestamp)
+
+    def _append(self, name, value, timestamp):
+        head = int(self._header[HEAD])
+        if head - int(self._header[TAIL]) >= self.capacity:
+            self._header[DROPPED] += 1
+            return False
+        slot = head % self.capacity
+        records = self._records
+        records["timestamp"][slot] = time.time() if timestamp is None else timestamp
+        records["value"][slot] = value
+        records["name"][slot] = self._encode(name)
+        records["seq"][slot] = head    # Marks the slot complete...
+        self._header[HEAD] = head + 1  # ...before it is published
+        return True
+
+    def close(self):
+        """Detach from the shared segment (the collector owns and unlinks it)."""
+        self._header = self._records = None
+        self._segment.close()
+
+    def __getstate__(self):
+        return {"segment_name": self.segment_name, "capacity": self.capacity, "lock": self._lock}
+
+    def __setstate__(self, state):
+        self.__init__(state["segment_name"], state["capacity"], state["lock"])
+
+# ============================================================================
+# METRIC COLLECTOR - Aggregator-side consumer
+# ============================================================================
+
+class MetricCollector:
+    """Create per-worker rings and drain them into a single backend.
+
+    Example:
+        with MetricCollector(num_workers=4, backend=MetricRegistry()) as collector:
+            workers = [Process(target=work, args=(collector.writer(rank),))
+                       for rank in range(4)]
+            ...
+        # In work(): set_metric_backend(writer); log_metric("rows", n)
+
+    backend is any object with record(name, value, timestamp), e.g. a
+    MetricBuffer, MetricRegistry or MetricLogWriter. mp_context is the
+    multiprocessing context the workers are started with; it is only used
+    to create the per-ring locks needed on weakly ordered CPUs.
+    """
+
+    def __init__(self, num_workers, backend, capacity=DEFAULT_CAPACITY,
+                 drain_interval_ms=DEFAULT_DRAIN_INTERVAL_MS, mp_context=None):
+        self.backend = backend
+        self.capacity = capacity
+        self.drain_interval_ms = drain_interval_ms
+        self._segments = []
+        self._rings = []
+        for _ in range(num_workers):
+            segment = shared_memory.SharedMemory(create=True, size=_ring_bytes(capacity))
+            header, records = _ring_views(segment, capacity)
+            header[:] = 0
+            records["seq"] = UNPUBLISHED
+            self._segments.append(segment)
+            self._rings.append((header, records))
+        self.received = [0] * num_workers  # Records drained per worker
+        self.dropped = [0] * num_workers   # Overflow drops per worker, as of the last drain
+        # Per-ring locks only where lock-free publishing is unsafe
+        mp_context = mp_context or multiprocessing.get_context()
+        self._locks = [None if STRONGLY_ORDERED else mp_context.Lock()
+                       for _ in range(num_workers)]
+        self._stop_event = threading.Event()
+        self._drain_thread = None
+        self._closed = False
+
+    def writer(self, worker_index):
+        """RingWriter for one worker; pass it to the worker process."""
+        return RingWriter(self._segments[worker_index].name, self.capacity,
+                          self._locks[worker_index])
+
+    def drain(self):
+        """Forward every published record to the backend, ring by ring, in order."""
+        drained = 0
+        for worker_index, (header, records) in enumerate(self._rings):
+            lock = self._locks[worker_index]
+            if lock is None:
+                batch = self._take(worker_index, header, records)
+            else:
+                with lock:
+                    batch = self._take(worker_index, header, records)
+            for name, value, timestamp in zip(batch["name"], batch["value"].tolist(),
+                                              batch["timestamp"].tolist()):
+                self.backend.record(name.decode("utf-8"), value, timestamp)
+            self.received[worker_index] += len(batch)
+            drained += len(batch)
+        return drained
+
+    def _take(self, worker_index, header, records):
+        """Copy published records out of one ring and free their slots."""
+        self.dropped[worker_index] = int(header[DROPPED])
+        tail = int(header[TAIL])
+        head = int(header[HEAD])
+        if head == tail:
+            return records[:0]
+        expected = np.arange(tail, head, dtype=np.uint64)
+        batch = records[expected % self.capacity]  # Copy out of the ring
+        incomplete = np.flatnonzero(batch["seq"] != expected)
+        if len(incomplete):
+            batch = batch[:incomplete[0]]  # Not visible yet: retry on the next drain
+        header[TAIL] = tail + len(batch)  # Free the slots for the producer
+        return batch
+
+    def stats(self):
+        """Received and dropped sample counts per worker."""
+        return [{"worker": index, "received": received, "dropped": dropped}
+                for index, (received, dropped) in enumerate(zip(self.received, self.dropped))]
+
+    def _drain_periodically(self):
+        interval = self.drain_interval_ms / 1000
+        while not self._stop_event.wait(interval):
+            self.drain()
+
+    def start(self):
+        """Drain on a background thread until close()."""
+        if self._drain_thread is None:
+            self._drain_thread = threading.Thread(target=self._drain_periodically, daemon=True)
+            self._drain_thread.start()
+        return self
+
+    def close(self):
+        """Final drain, then release the shared memory segments."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop_event.set()
+        if self._drain_thread is not None:
+            self._drain_thread.join()
+        self.drain()
+        self._rings = []
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        # MLOps use: metrics from data-parallel preprocessing workers without a shared lock
@@ -6,12 +6,231 @@ mlops_utils/logging.py - Logging Module
 Part of mlops_utils package:
 - Contains logging and monitoring functions
 - Focused on experiment tracking and metrics
+- Buffers metrics in memory and flushes them in batches to pluggable sinks
+- Aggregates metrics in constant memory per name (see metrics.py)
+- Writes compact binary metric logs with range queries (see metric_store.py)
+- Collects metrics from worker processes via shared memory (see collector.py)
 - Provides utilities for MLOps observability
 """
 
+import atexit
+import json
+import socket
+import sys
+import threading
+import time
+
+from .collector import MetricCollector, RingWriter              # Multi-process collection
+from .metric_store import MetricLogReader, MetricLogWriter      # Binary metric logs
+from .metrics import Counter, Gauge, Histogram, MetricRegistry  # Aggregated metric types
+
+# ============================================================================
+# METRIC BUFFER CONFIGURATION - When buffered metrics are written out
+# ============================================================================
+
+DEFAULT_FLUSH_EVERY = 1000         # Flush after this many buffered records...
+DEFAULT_FLUSH_INTERVAL_MS = 1000   # ...or after this many milliseconds
+MAX_DATAGRAM_BYTES = 60 * 1024     # Payload limit per socket datagram
+
+# ============================================================================
+# METRIC SINKS - Destinations that receive batches of records
+# ============================================================================
+# A sink is any object with write(records) and close(); records is a list of
+# (timestamp, name, value) tuples.
+
+class StdoutSink:
+    """Print metrics as 'name = value' lines, one write per batch."""
+
+    def write(self, records):
+        sys.stdout.write("".join(f"{name} = {value}\n" for _, name, value in records))
+        sys.stdout.flush()
+
+    def close(self):
+        pass
+
+
+class JsonlFileSink:
+    """Append metrics to a JSON Lines file."""
+
+    def __init__(self, path):
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, records):
+        self._file.write("".join(
+            json.dumps({"ts": timestamp, "name": name, "value": value}) + "\n"
+            for timestamp, name, value in records
+        ))
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class SocketSink:
+    """Send metrics as JSON Lines datagrams to a local collector.
+
+    address is a (host, port) tuple for UDP or a filesystem path for a Unix
+    datagram socket. Delivery is best-effort: if no collector is listening
+    the batch is dropped and counted in dropped_batches, so metrics never
+    block or crash training.
+    """
+
+    def __init__(self, address):
+        self.address = address
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._socket = socket.socket(family, socket.SOCK_DGRAM)
+        self.dropped_batches = 0
+
+    def _send(self, payload):
+        try:
+            self._socket.sendto(payload, self.address)
+        except OSError:
+            self.dropped_batches += 1
+
+    def write(self, records):
+        payload = b""
+        for timestamp, name, value in records:
+            line = (json.dumps({"ts": timestamp, "name": name, "value": value}) + "\n").encode("utf-8")
+            if payload and len(payload) + len(line) > MAX_DATAGRAM_BYTES:
+                self._send(payload)
+                payload = b""
+            payload += line
+        if payload:
+            self._send(payload)
+
+    def close(self):
+        self._socket.close()
+
+# ============================================================================
+# METRIC BUFFER - Batches records in memory between flushes
+# ============================================================================
+
+class MetricBuffer:
+    """In-memory metric buffer flushed every N records or every T milliseconds.
+
+    record() only appends to a list; sink I/O happens in flush(), which
+    runs when the buffer is full, on a background timer, and at interpreter
+    exit (atexit), so buffered metrics are written even if the caller
+    never calls close(). Abrupt kills (SIGKILL, os._exit) cannot be covered.
+
+    A sink that raises does not stop the others from receiving the batch;
+    failures are counted in flush_errors (the last one is kept in
+    last_flush_error). Automatic flushes (a full buffer in record(), the
+    timer thread) never raise, so a full disk does not surface inside a
+    training step; explicit flush() and close() re-raise the first sink
+    error. record() after close() raises RuntimeError instead of dropping
+    the value.
+    """
+
+    def __init__(self, sinks=None, flush_every=DEFAULT_FLUSH_EVERY,
+                 flush_interval_ms=DEFAULT_FLUSH_INTERVAL_MS):
+        self.sinks = list(sinks) if sinks else [StdoutSink()]
+        self.flush_every = flush_every
+        self.flush_interval_ms = flush_interval_ms
+        self._records = []
+        self._lock = threading.Lock()        # Guards _records
+        self._flush_lock = threading.Lock()  # Keeps batches in order across threads
+        self._stop_event = threading.Event()
+        self._closed = False
+        self.flush_errors = 0
+        self.last_flush_error = None
+        if flush_interval_ms:
+            self._timer_thread = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._timer_thread.start()
+        else:
+            self._timer_thread = None
+        atexit.register(self.close)
+
+    def record(self, name, value, timestamp=None):
+        """Buffer one metric value."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"MetricBuffer is closed; cannot record '{name}'")
+            self._records.append((time.time() if timestamp is None else timestamp, name, value))
+            is_full = len(self._records) >= self.flush_every
+        if is_full:
+            self._flush_quietly()
+
+    def flush(self):
+        """Write buffered records to every sink; re-raises the first sink error."""
+        with self._flush_lock:
+            with self._lock:
+                records, self._records = self._records, []
+            if not records:
+                return
+            first_error = None
+            for sink in self.sinks:
+                try:
+                    sink.write(records)
+                except Exception as error:  # Still give the batch to the other sinks
+                    self.flush_errors += 1
+                    self.last_flush_error = error
+                    first_error = first_error or error
+            if first_error is not None:
+                raise first_error
+
+    def _flush_quietly(self):
+        """flush() for automatic flushes; sink errors are already counted in flush_errors."""
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def _flush_periodically(self):
+        interval = self.flush_interval_ms / 1000
+        while not self._stop_event.wait(interval):
+            self._flush_quietly()  # A dead timer thread would stop all flushing
+
+    def close(self):
+        """Flush remaining records and close sinks (safe to call twice)."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True  # Records appended before this are flushed below
+        self._stop_event.set()
+        if self._timer_thread is not None:
+            self._timer_thread.join()
+        try:
+            self.flush()
+        finally:
+            for sink in self.sinks:
+                sink.close()
+            atexit.unregister(self.close)
+
+# ============================================================================
+# METRIC LOGGING API - Module-level entry point
+# ============================================================================
+
+_backend = None  # Object with record(name, value); created on first use
+
+
+def set_metric_backend(backend):
+    """Route log_metric() to backend (any object with record(name, value)).
+
+    Use a MetricBuffer to write every value out, a MetricRegistry to keep
+    only aggregates (count, mean, quantiles) per metric name, or a
+    MetricLogWriter for a compact binary log with fast range queries.
+    In multiprocessing workers, use the worker's RingWriter from a
+    MetricCollector so processes never contend on stdout or a shared lock.
+    Returns the previous backend so callers can restore or close it.
+    """
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
+
+
+def configure_metrics(sinks=None, flush_every=DEFAULT_FLUSH_EVERY,
+                      flush_interval_ms=DEFAULT_FLUSH_INTERVAL_MS):
+    """Replace the default buffer with one writing to the given sinks."""
+    previous = set_metric_backend(MetricBuffer(sinks, flush_every, flush_interval_ms))
+    if isinstance(previous, MetricBuffer):
+        previous.close()  # Write out what the old buffer still holds
+    return _backend
+
+
 def log_metric(name, value):
     """Log a metric with name and value."""
-    print(f"{name} = {value}")
+    if _backend is None:
+        set_metric_backend(MetricBuffer())
+    _backend.record(name, value)
     # MLOps use: experiment tracking, performance monitoring, metric logging
-
-
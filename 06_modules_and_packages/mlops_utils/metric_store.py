@@ -0,0 +1,218 @@
+#!/usr/bin/python3
+
+"""
+mlops_utils/metric_store.py - Binary Metric Log Module
+
+Part of mlops_utils package:
+- Compact append-only binary format for (name, timestamp, value) metrics
+- Metric names are interned to integer ids
+- Per-block min/max timestamp index kept in a separate file
+- Reader loads one metric's time range as NumPy arrays through mmap
+
+Files written for a log at base path P:
+- P.names  metric names, one per line (line number = name id)
+- P.bin    column blocks: float64 timestamps followed by float64 values
+- P.idx    one INDEX_DTYPE entry per block
+"""
+
+import atexit
+import time
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+# ============================================================================
+# FORMAT DEFINITION - Block size and index layout
+# ============================================================================
+
+DEFAULT_BLOCK_SIZE = 4096  # Records per metric buffered before a block is written
+
+INDEX_DTYPE = np.dtype([
+    ("name_id", "<u4"),   # Interned metric name
+    ("count", "<u4"),     # Records in the block
+    ("offset", "<u8"),    # Byte offset of the block in P.bin
+    ("min_ts", "<f8"),    # Earliest timestamp in the block
+    ("max_ts", "<f8"),    # Latest timestamp in the block
+])
+
+
+def _log_files(path):
+    base = str(path)
+    return Path(base + ".names"), Path(base + ".bin"), Path(base + ".idx")
+
+
+def _read_names(names_path):
+    if not names_path.exists():
+        return []
+    return names_path.read_text(encoding="utf-8").splitlines()
+
+
+def _read_index(index_path):
+    """Complete index entries; a torn last entry (crash mid-write) is ignored."""
+    index_bytes = index_path.read_bytes() if index_path.exists() else b""
+    complete = len(index_bytes) // INDEX_DTYPE.itemsize
+    return np.frombuffer(index_bytes[:complete * INDEX_DTYPE.itemsize], dtype=INDEX_DTYPE)
+
+
+def _repair(names_path, data_path, index_path):
+    """Cut off anything a crash left behind after the last complete block.
+
+    P.bin is truncated to the end of the last indexed block (offset plus
+    16 bytes per record), P.idx to whole entries and P.names to whole
+    lines, so appends start aligned and offsets in new entries are valid.
+    """
+    index = _read_index(index_path)
+    if index_path.exists() and index_path.stat().st_size != index.nbytes:
+        with open(index_path, "r+b") as f:
+            f.truncate(index.nbytes)
+    data_end = int((index["offset"] + 16 * index["count"].astype(np.uint64)).max()) if len(index) else 0
+    if data_path.exists() and data_path.stat().st_size > data_end:
+        with open(data_path, "r+b") as f:
+            f.truncate(data_end)
+    if names_path.exists():
+        names = names_path.read_bytes()
+        if names and not names.endswith(b"\n"):
+            with open(names_path, "r+b") as f:
+                f.truncate(names.rfind(b"\n") + 1)  # No block uses an id before its line is complete
+
+# ============================================================================
+# WRITER - Array-backed buffers per metric, flushed as column blocks
+# ============================================================================
+
+class MetricLogWriter:
+    """Append metrics to a binary metric log.
+
+    Each metric name buffers timestamps and values in array('d') columns;
+    a full buffer is written as one block. Data is written before its
+    index entry, so a crash can lose the last unflushed block but never
+    leaves an index entry pointing at missing data. Opening an existing
+    log cuts off a partially written block (see _repair), so a crash
+    during a write loses that block but leaves the log readable. Usable as a
+    log_metric() backend via logging.set_metric_backend().
+    """
+
+    def __init__(self, path, block_size=DEFAULT_BLOCK_SIZE):
+        self.path = Path(path)
+        self.block_size = block_size
+        names_path, data_path, index_path = _log_files(self.path)
+        _repair(names_path, data_path, index_path)
+        self._name_ids = {name: name_id for name_id, name in enumerate(_read_names(names_path))}
+        self._names_file = open(names_path, "a", encoding="utf-8")
+        self._data_file = open(data_path, "ab")
+        self._index_file = open(index_path, "ab")
+        self._buffers = {}  # name_id -> (timestamps, values)
+        self._closed = False
+        atexit.register(self.close)
+
+    def _intern(self, name):
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            if "\n" in name:
+                raise ValueError("Metric names cannot contain newlines")
+            name_id = len(self._name_ids)
+            self._name_ids[name] = name_id
+            self._names_file.write(name + "\n")
+            self._names_file.flush()  # Name is on disk before any block uses its id
+        return name_id
+
+    def record(self, name, value, timestamp=None):
+        """Buffer one metric value."""
+        name_id = self._intern(name)
+        buffers = self._buffers.get(name_id)
+        if buffers is None:
+            buffers = self._buffers[name_id] = (array("d"), array("d"))
+        timestamps, values = buffers
+        timestamps.append(time.time() if timestamp is None else timestamp)
+        values.append(value)
+        if len(values) >= self.block_size:
+            self._write_block(name_id)
+
+    def _write_block(self, name_id):
+        timestamps, values = self._buffers.pop(name_id)
+        ts_column = np.frombuffer(timestamps, dtype=np.float64)
+        entry = np.zeros(1, dtype=INDEX_DTYPE)
+        entry["name_id"] = name_id
+        entry["count"] = len(values)
+        entry["offset"] = self._data_file.tell()
+        entry["min_ts"] = ts_column.min()
+        entry["max_ts"] = ts_column.max()
+        self._data_file.write(timestamps.tobytes())
+        self._data_file.write(values.tobytes())
+        self._data_file.flush()
+        self._index_file.write(entry.tobytes())
+
+    def flush(self):
+        """Write every partially filled buffer as a block."""
+        for name_id in list(self._buffers):
+            self._write_block(name_id)
+        self._index_file.flush()
+
+    def close(self):
+        """Flush and close the log files (safe to call twice)."""
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        for f in (self._names_file, self._data_file, self._index_file):
+            f.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# ============================================================================
+# READER - Index lookup plus memory-mapped block access
+# ============================================================================
+
+class MetricLogReader:
+    """Read metric series from a binary metric log.
+
+    Only index entries are loaded eagerly; block data is memory-mapped,
+    so reading one curve touches just the blocks overlapping the range.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        names_path, data_path, index_path = _log_files(self.path)
+        self.names = _read_names(names_path)
+        self._name_ids = {name: name_id for name_id, name in enumerate(self.names)}
+        self.index = _read_index(index_path)
+        records = data_path.stat().st_size // 8 if data_path.exists() else 0  # Skip a torn tail
+        self._data = np.memmap(data_path, dtype=np.float64, mode="r", shape=(records,)) if records else None
+
+    def metrics(self):
+        """Names of all metrics in the log."""
+        return list(self.names)
+
+    def series(self, name, start=None, end=None):
+        """Timestamps and values of one metric with start <= ts <= end.
+
+        Returns:
+            (timestamps, values) float64 arrays sorted by block order
+        """
+        empty = np.empty(0, dtype=np.float64)
+        name_id = self._name_ids.get(name)
+        if name_id is None or self._data is None:
+            return empty, empty
+        start = -np.inf if start is None else start
+        end = np.inf if end is None else end
+        blocks = self.index[(self.index["name_id"] == name_id)
+                            & (self.index["max_ts"] >= start)
+                            & (self.index["min_ts"] <= end)]
+        ts_parts, value_parts = [], []
+        for block in blocks:
+            first = int(block["offset"]) // 8  # Offsets are in bytes, data in float64
+            count = int(block["count"])
+            timestamps = self._data[first:first + count]
+            values = self._data[first + count:first + 2 * count]
+            in_range = (timestamps >= start) & (timestamps <= end)
+            ts_parts.append(timestamps[in_range])
+            value_parts.append(values[in_range])
+        if not ts_parts:
+            return empty, empty
+        return np.concatenate(ts_parts), np.concatenate(value_parts)
+        # MLOps use: plot one training curve without scanning the whole log
@@ -0,0 +1,263 @@
+#!/usr/bin/python3
+
+"""
+mlops_utils/metrics.py - Aggregated Metrics Module
+
+Part of mlops_utils package:
+- Counters, gauges and histograms with constant memory per metric name
+- Histograms backed by a mergeable DDSketch quantile sketch
+- Registries from many processes can be merged into one summary
+- Works as a log_metric() backend (see logging.set_metric_backend)
+"""
+
+import math
+import threading
+import time
+
+# ============================================================================
+# SKETCH CONFIGURATION - Accuracy and memory bounds
+# ============================================================================
+
+DEFAULT_RELATIVE_ACCURACY = 0.01  # Quantiles within 1% of the true value
+DEFAULT_MAX_BINS = 2048           # Upper bound on buckets kept per sign
+MIN_TRACKED_VALUE = 1e-9          # Smaller magnitudes are counted as zero
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+# ============================================================================
+# DDSKETCH - Mergeable quantile sketch with relative-error guarantees
+# ============================================================================
+
+class DDSketch:
+    """Quantile sketch with logarithmic buckets (Masson et al., VLDB 2019).
+
+    A value v > 0 lands in bucket ceil(log_gamma(v)); every value in a
+    bucket is within relative_accuracy of the bucket's representative
+    value, so quantiles carry the same relative error. Memory is bounded
+    by max_bins: when exceeded, the lowest buckets are collapsed, which
+    only affects accuracy of the smallest values. Two sketches with the
+    same relative_accuracy merge by adding bucket counts.
+
+    NaN and infinite values (e.g. a diverged loss) are only counted, in
+    nan_count and inf_count; they stay out of the buckets, count, sum,
+    min and max, so quantiles and the mean describe the finite values.
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY, max_bins=DEFAULT_MAX_BINS):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = {}  # Bucket key -> count for values > 0
+        self._negative = {}  # Bucket key -> count for |values| of values < 0
+        self.zero_count = 0
+        self.nan_count = 0
+        self.inf_count = 0   # +inf and -inf
+        self.count = 0       # Finite values only
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _key(self, magnitude):
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key):
+        return 2 * self._gamma ** key / (self._gamma + 1)  # Bucket midpoint (relative)
+
+    def _collapse(self, bins):
+        """Merge the lowest bucket into its neighbour until within max_bins."""
+        while len(bins) > self.max_bins:
+            lowest = min(bins)
+            count = bins.pop(lowest)
+            neighbour = min(bins)
+            bins[neighbour] += count
+
+    def add(self, value, count=1):
+        """Add a value (optionally with a repeat count)."""
+        if math.isnan(value):
+            self.nan_count += count
+            return
+        if math.isinf(value):
+            self.inf_count += count
+            return
+        if value > MIN_TRACKED_VALUE:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + count
+            if len(self._positive) > self.max_bins:
+                self._collapse(self._positive)
+        elif value < -MIN_TRACKED_VALUE:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + count
+            if len(self._negative) > self.max_bins:
+                self._collapse(self._negative)
+        else:
+            self.zero_count += count
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Approximate q-quantile (0 <= q <= 1); None when empty."""
+        if self.count == 0:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):  # Most negative first
+            seen += self._negative[key]
+            if seen > rank:
+                return max(self.min, -self._value(key))
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return min(self.max, self._value(key))
+        return self.max
+
+    def merge(self, other):
+        """Add another sketch's counts into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Can only merge sketches with the same relative_accuracy")
+        for own_bins, other_bins in ((self._positive, other._positive),
+                                     (self._negative, other._negative)):
+            for key, count in other_bins.items():
+                own_bins[key] = own_bins.get(key, 0) + count
+            self._collapse(own_bins)
+        self.zero_count += other.zero_count
+        self.nan_count += other.nan_count
+        self.inf_count += other.inf_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+# ============================================================================
+# METRIC TYPES - Counter, Gauge, Histogram
+# ============================================================================
+
+class Counter:
+    """Monotonic total, e.g. processed samples or errors."""
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def merge(self, other):
+        self.value += other.value
+        return self
+
+    def summary(self):
+        return {"type": "counter", "value": self.value}
+
+
+class Gauge:
+    """Last observed value, e.g. learning rate or queue depth."""
+
+    def __init__(self):
+        self.value = None
+        self.timestamp = None
+
+    def set(self, value, timestamp=None):
+        self.value = value
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def merge(self, other):
+        if other.timestamp is not None and (self.timestamp is None or other.timestamp > self.timestamp):
+            self.value, self.timestamp = other.value, other.timestamp  # Latest write wins
+        return self
+
+    def summary(self):
+        return {"type": "gauge", "value": self.value}
+
+
+class Histogram:
+    """Distribution summary (count, mean, min, max, quantiles) in bounded memory."""
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY, max_bins=DEFAULT_MAX_BINS):
+        self.sketch = DDSketch(relative_accuracy, max_bins)
+
+    def observe(self, value):
+        self.sketch.add(value)
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def merge(self, other):
+        self.sketch.merge(other.sketch)
+        return self
+
+    def summary(self, quantiles=DEFAULT_QUANTILES):
+        sketch = self.sketch
+        result = {"type": "histogram", "count": sketch.count,
+                  "mean": sketch.sum / sketch.count if sketch.count else None,
+                  "min": sketch.min if sketch.count else None,
+                  "max": sketch.max if sketch.count else None,
+                  "nan_count": sketch.nan_count, "inf_count": sketch.inf_count}
+        for q in quantiles:
+            result[f"p{q * 100:g}"] = sketch.quantile(q)
+        return result
+
+# ============================================================================
+# METRIC REGISTRY - Named metrics, mergeable across processes
+# ============================================================================
+
+class MetricRegistry:
+    """Collection of named metrics.
+
+    Updates are not locked, so give each thread or process its own
+    registry and merge() them at the end. Registries pickle cleanly,
+    which lets worker processes return them to the parent.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()  # Guards metric creation only
+
+    def _get(self, name, metric_type):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(name, metric_type())
+        if not isinstance(metric, metric_type):
+            raise TypeError(f"Metric '{name}' is a {type(metric).__name__}, not a {metric_type.__name__}")
+        return metric
+
+    def counter(self, name):
+        return self._get(name, Counter)
+
+    def gauge(self, name):
+        return self._get(name, Gauge)
+
+    def histogram(self, name):
+        return self._get(name, Histogram)
+
+    def record(self, name, value, timestamp=None):
+        """log_metric() backend hook - every logged value feeds a histogram."""
+        self.histogram(name).observe(value)
+
+    def merge(self, other):
+        """Fold another registry (e.g. from a worker process) into this one."""
+        for name, metric in other._metrics.items():
+            own = self._get(name, type(metric))
+            own.merge(metric)
+        return self
+
+    def snapshot(self):
+        """Summaries of every metric, keyed by name."""
+        return {name: metric.summary() for name, metric in sorted(self._metrics.items())}
+
+    def __getstate__(self):
+        return {"_metrics": self._metrics}
+
+    def __setstate__(self, state):
+        self._metrics = state["_metrics"]
+        self._lock = threading.Lock()
+        # MLOps use: p50/p99 latency and loss distributions without storing raw values
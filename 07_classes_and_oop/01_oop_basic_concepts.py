@@ -70,3 +70,192 @@ for d in [CSVDataset("train.csv")]:
     # MLOps use: different models with same interface (train, predict)
 
 
+# ============================================================================
+# SHARDING & CHECKPOINTS - Splitting one dataset across parallel workers
+# ============================================================================
+
+import csv
+import json
+import os
+import tempfile
+
+class Dataset:
+    """Dataset that can be split into disjoint shards by byte range."""
+    def __init__(self, path, num_shards=1, shard_index=0):
+        """Initialize dataset with file path and the shard this worker reads."""
+        if not 0 <= shard_index < num_shards:
+            raise ValueError(f"shard_index must be in [0, {num_shards})")
+        self.path = path
+        self.num_shards = num_shards
+        self.shard_index = shard_index
+        self.offset = None  # Byte offset of the next unread row (None = not started)
+
+    def load(self):
+        """Method to load dataset - defines object behavior."""
+        print(f"Loading shard {self.shard_index}/{self.num_shards} from {self.path}")
+
+    def shard(self, num_shards, shard_index):
+        """Return a new dataset object covering one shard of this file."""
+        return type(self)(self.path, num_shards, shard_index)
+        # Every worker calls shard(world_size, rank) and reads only its part
+
+    def byte_range(self):
+        """Byte range [start, end) owned by this shard - same split on every host."""
+        size = os.path.getsize(self.path)
+        start = size * self.shard_index // self.num_shards
+        end = size * (self.shard_index + 1) // self.num_shards
+        return start, end
+
+    def state_dict(self):
+        """Checkpointable reader position."""
+        return {"path": str(self.path), "num_shards": self.num_shards,
+                "shard_index": self.shard_index, "offset": self.offset}
+
+    def load_state_dict(self, state):
+        """Resume from a state produced by state_dict()."""
+        expected = (str(self.path), self.num_shards, self.shard_index)
+        if (state["path"], state["num_shards"], state["shard_index"]) != expected:
+            raise ValueError("Checkpoint belongs to a different dataset shard")
+        self.offset = state["offset"]
+
+    def save_checkpoint(self, checkpoint_path):
+        """Write the reader position atomically so a crash never leaves half a file."""
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state_dict(), f)
+        os.replace(tmp_path, checkpoint_path)
+
+    def load_checkpoint(self, checkpoint_path):
+        """Restore the reader position if a checkpoint exists."""
+        if os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as f:
+                self.load_state_dict(json.load(f))
+
+class CSVDataset(Dataset):
+    """CSV dataset whose shards are aligned to line boundaries.
+
+    Limitation: every physical line is parsed as one row, so quoted fields
+    containing newlines are not supported - such a row is split into broken
+    rows (possibly in different shards) without an error.
+    """
+    def parse(self):
+        """Yield this shard's rows, resuming from the checkpointed offset.
+
+        A row belongs to the shard whose byte range contains its first byte,
+        so shards never overlap and together cover every row exactly once
+        (for files without newlines inside quoted fields).
+        """
+        start, end = self.byte_range()
+        with open(self.path, "rb") as f:
+            self.header = next(csv.reader([f.readline().decode("utf-8")]), [])
+            position = max(start, f.tell())  # Rows start after the header line
+            if self.offset is not None:
+                position = self.offset       # Resume mid-shard
+            elif position > f.tell():
+                f.seek(position - 1)
+                f.readline()                 # Skip the row owned by the previous shard
+                position = f.tell()
+            f.seek(position)
+            while position < end:
+                line = f.readline()
+                if not line:
+                    break
+                position += len(line)
+                if line.strip():
+                    yield next(csv.reader([line.decode("utf-8")]))
+                self.offset = position  # Advanced only after the row was consumed
+        # MLOps use: data-parallel ingestion that scales across cores and hosts
+
+# Split a small file across three workers and resume one of them
+with tempfile.TemporaryDirectory() as tmp_dir:
+    data_path = os.path.join(tmp_dir, "train.csv")
+    with open(data_path, "w") as f:
+        f.write("id,label\n" + "".join(f"{i},{i % 2}\n" for i in range(10)))
+
+    shards = [CSVDataset(data_path).shard(3, rank) for rank in range(3)]
+    print([[row[0] for row in s.parse()] for s in shards])  # Disjoint row ids per shard
+
+    checkpoint_path = os.path.join(tmp_dir, "shard0.ckpt")
+    reader = CSVDataset(data_path).shard(3, 0)
+    rows = reader.parse()
+    next(rows)                               # Row "0" processed
+    next(rows)                               # Row "1" in progress...
+    reader.save_checkpoint(checkpoint_path)  # ...checkpoint, then "crash"
+
+    resumed = CSVDataset(data_path).shard(3, 0)
+    resumed.load_checkpoint(checkpoint_path)
+    print([row[0] for row in resumed.parse()])  # Re-reads only the unfinished row "1"
+
+# ============================================================================
+# COLUMNAR DATASETS - Projection and predicate pushdown with pyarrow
+# ============================================================================
+
+import pyarrow as pa
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
+
+class ParquetDataset(Dataset):
+    """Columnar Parquet dataset that reads only the columns and row groups it needs.
+
+    select() and where() return new datasets instead of reading anything;
+    data is read in parse(), where the projection limits which column
+    chunks are fetched and the predicate skips row groups whose min/max
+    statistics cannot match. Shards are assigned whole row groups.
+    """
+    def __init__(self, path, num_shards=1, shard_index=0, columns=None, predicate=None):
+        super().__init__(path, num_shards, shard_index)
+        self.columns = columns      # Projection (None = all columns)
+        self.predicate = predicate  # pyarrow compute expression (None = all rows)
+
+    def _copy(self, **changes):
+        options = {"num_shards": self.num_shards, "shard_index": self.shard_index,
+                   "columns": self.columns, "predicate": self.predicate}
+        options.update(changes)
+        return type(self)(self.path, **options)
+
+    def shard(self, num_shards, shard_index):
+        """Return a new dataset covering every num_shards-th row group."""
+        return self._copy(num_shards=num_shards, shard_index=shard_index)
+
+    def select(self, columns):
+        """Projection pushdown - only these columns are read from disk."""
+        return self._copy(columns=list(columns))
+
+    def where(self, predicate):
+        """Predicate pushdown - combined with any earlier where() using AND."""
+        combined = predicate if self.predicate is None else self.predicate & predicate
+        return self._copy(predicate=combined)
+
+    def _row_groups(self):
+        """This shard's row groups, in file order (one fragment per row group)."""
+        row_groups = [row_group
+                      for fragment in pads.dataset(self.path, format="parquet").get_fragments()
+                      for row_group in fragment.split_by_row_group()]
+        return row_groups[self.shard_index::self.num_shards]
+
+    def parse(self):
+        """Yield record batches, resuming after the last fully read row group."""
+        row_groups = self._row_groups()
+        start = self.offset or 0  # Offset counts this shard's finished row groups
+        for position, row_group in enumerate(row_groups[start:], start):
+            yield from row_group.to_batches(columns=self.columns, filter=self.predicate)
+            self.offset = position + 1
+
+    def to_table(self):
+        """Read this shard into one pyarrow Table."""
+        schema = pads.dataset(self.path, format="parquet").schema
+        if self.columns is not None:
+            schema = pa.schema([schema.field(name) for name in self.columns])
+        return pa.Table.from_batches(list(self.parse()), schema=schema)
+        # MLOps use: feature jobs that touch 5 of 300 columns read ~5 columns
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    data_path = os.path.join(tmp_dir, "train.parquet")
+    table = pa.table({"age": list(range(20, 60)), "income": [1000.0 * i for i in range(40)]})
+    pq.write_table(table, data_path, row_group_size=10)  # 4 row groups with min/max stats
+
+    age = pads.field("age")
+    dataset = ParquetDataset(data_path)
+    adults = dataset.select(["age"]).where(age > 50).to_table()
+    print(adults.column_names, adults.num_rows)  # ['age'] 9 - income never read
+    print([ParquetDataset(data_path).shard(2, rank).to_table().num_rows for rank in range(2)])  # [20, 20]
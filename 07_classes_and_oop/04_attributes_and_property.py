@@ -104,3 +104,73 @@ class Dataset:
 # print(dataset.size)  # 3 - calculated from current samples
 # dataset.samples.append(4)
 # print(dataset.size)  # 4 - automatically updated
+
+# ============================================================================
+# LAZY PROPERTIES WITH __slots__ - Cheap handles, data loaded on demand
+# ============================================================================
+
+import csv
+import os
+import tempfile
+
+class LazyDataset:
+    """Dataset handle that reads metadata up front and columns only on access."""
+    __slots__ = ("_path", "_schema", "_num_rows", "_columns")
+    # __slots__ replaces the per-instance __dict__ with fixed attribute slots,
+    # so thousands of handles in a catalog scan stay small in memory
+
+    def __init__(self, path):
+        self._path = path
+        self._num_rows = None  # Counted on first access to size
+        self._columns = {}     # Column name -> materialized values
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            self._schema = tuple(next(csv.reader(f), ()))  # Header line only
+
+    @property
+    def path(self):
+        """Get the dataset path."""
+        return self._path
+
+    @property
+    def schema(self):
+        """Column names, read from the header on construction."""
+        return self._schema
+
+    @property
+    def size(self):
+        """Row count without parsing or storing rows.
+
+        Blank lines are not rows, matching column(), which skips them.
+        """
+        if self._num_rows is None:
+            with open(self._path, "rb") as f:
+                line_count = sum(1 for line in f if line.strip(b"\r\n"))
+            self._num_rows = max(0, line_count - 1)  # Exclude the header
+        return self._num_rows
+
+    def column(self, name):
+        """Materialize one column the first time it is requested."""
+        if name not in self._columns:
+            if name not in self._schema:
+                raise KeyError(f"Unknown column '{name}'")
+            column_index = self._schema.index(name)
+            with open(self._path, "r", newline="", encoding="utf-8") as f:
+                rows = csv.reader(f)
+                next(rows, None)  # Skip header
+                self._columns[name] = [row[column_index] for row in rows if row]
+        return self._columns[name]
+
+    def __getitem__(self, name):
+        return self.column(name)
+        # MLOps use: catalog scans, feature selection without full loads
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    data_path = os.path.join(tmp_dir, "train.csv")
+    with open(data_path, "w") as f:
+        f.write("age,label\n30,1\n45,0\n27,1\n")
+
+    dataset = LazyDataset(data_path)  # Reads only the header
+    print(dataset.schema)             # ('age', 'label')
+    print(dataset.size)               # 3 - counted, rows never materialized
+    print(dataset["age"])             # ['30', '45', '27'] - loaded on first access
+    print(hasattr(dataset, "__dict__"))  # False - attributes live in slots
@@ -0,0 +1,188 @@
+#!/usr/bin/python3
+
+"""
+log_follower.py - Incremental Log Follower
+
+tail -F style processing of growing log files:
+- Reads only bytes appended since the last read
+- Holds back a partial last line until its newline arrives
+- Detects rotation (new inode) and truncation (file got smaller)
+- Persists (inode, offset) in a JSON checkpoint, written atomically,
+  so a restarted process continues where it stopped
+
+Usage:
+    follower = LogFollower("train.log", checkpoint_path="train.log.offset")
+    for line in follower.follow():
+        extract_metrics(line)
+"""
+
+import json
+import os
+import sys
+import threading
+
+# ============================================================================
+# DEFAULTS - Polling and read sizes
+# ============================================================================
+
+DEFAULT_POLL_INTERVAL = 1.0            # Seconds between checks when idle
+DEFAULT_READ_BYTES = 1024 * 1024       # Bytes read per call while catching up
+
+# ============================================================================
+# LOG FOLLOWER - New complete lines, rotation and truncation aware
+# ============================================================================
+
+class LogFollower:
+    """Follow a growing log file and return each complete line once.
+
+    self.offset always points just past the last line handed out, and
+    save_checkpoint() stores it with the file's inode. On startup a
+    checkpoint for the same inode resumes at its offset; a different
+    inode (the file was rotated while stopped) starts the new file from
+    the beginning. Lines still in the rotated-away file at that point are
+    not read.
+
+    When the file is rotated while following, the old file is read to its
+    end (including a final line without a newline) before switching.
+    """
+
+    def __init__(self, path, checkpoint_path=None, poll_interval=DEFAULT_POLL_INTERVAL,
+                 read_bytes=DEFAULT_READ_BYTES, encoding="utf-8"):
+        self.path = path
+        self.checkpoint_path = checkpoint_path
+        self.poll_interval = poll_interval
+        self.read_bytes = read_bytes
+        self.encoding = encoding
+        self.inode = None
+        self.offset = 0
+        self.caught_up = True  # False while unread data is known to be waiting
+        self._file = None
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            self.load_checkpoint()
+
+    # ------------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------------
+
+    def load_checkpoint(self):
+        with open(self.checkpoint_path, "r") as f:
+            state = json.load(f)
+        self.inode = state["inode"]
+        self.offset = state["offset"]
+
+    def save_checkpoint(self):
+        """Write {path, inode, offset} atomically (temp file + os.replace)."""
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"path": self.path, "inode": self.inode, "offset": self.offset}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.checkpoint_path)  # Readers never see a partial checkpoint
+
+    # ------------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------------
+
+    def _open(self):
+        """Open the current file; returns False if it does not exist yet."""
+        try:
+            log_file = open(self.path, "rb")
+        except FileNotFoundError:
+            return False
+        stat = os.fstat(log_file.fileno())
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            self.offset = 0  # New file, or checkpoint beyond the end
+        self.inode = stat.st_ino
+        self._file = log_file
+        return True
+
+    def _read_block(self, final=False):
+        """Complete lines in the next read_bytes block after self.offset.
+
+        Reads further only while no newline has been found (a line longer
+        than a block). Returns (lines, at_end); at_end is True when the
+        read reached the end of the file. With final=True a trailing
+        partial line at the end is returned as well (the file will not
+        grow any more).
+        """
+        self._file.seek(self.offset)
+        data = self._file.read(self.read_bytes)
+        at_end = len(data) < self.read_bytes
+        end = data.rfind(b"\n") + 1
+        while end == 0 and not at_end:
+            block = self._file.read(self.read_bytes)
+            data += block
+            at_end = len(block) < self.read_bytes
+            end = data.rfind(b"\n") + 1
+        lines = data[:end - 1].split(b"\n") if end else []
+        self.offset += end
+        if final and at_end and len(data) > end:
+            lines.append(data[end:])
+            self.offset += len(data) - end
+        return [line.rstrip(b"\r").decode(self.encoding, errors="replace") for line in lines], at_end
+
+    def read_new_lines(self):
+        """Next block of lines appended since the last call (empty list if none).
+
+        Returns at most about read_bytes of lines; self.caught_up is False
+        while more data is already waiting, so call again without sleeping.
+        """
+        self.caught_up = True
+        if self._file is None and not self._open():
+            return []
+        lines, at_end = self._read_block()
+        if not at_end:
+            self.caught_up = False
+            return lines
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return lines  # Rotated away, new file not created yet: keep the old handle
+        if stat.st_ino != self.inode:
+            rest, at_end = self._read_block(final=True)  # Rest of the rotated file
+            lines.extend(rest)
+            if at_end:
+                self._file.close()
+                self._file = None
+                self._open()
+            self.caught_up = False
+        elif stat.st_size < self.offset:
+            self.offset = 0  # Truncated in place (e.g. copytruncate)
+            self.caught_up = False
+        return lines
+
+    def follow(self, stop_event=None):
+        """Yield new lines forever (or until stop_event is set).
+
+        Lines are read one read_bytes block at a time and the checkpoint is
+        saved after the caller has processed every line of a block, so a
+        crash repeats at most one block and memory does not grow with the
+        backlog.
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            lines = self.read_new_lines()
+            for line in lines:
+                yield line
+            if lines and self.checkpoint_path:
+                self.save_checkpoint()
+            if self.caught_up:
+                stop_event.wait(self.poll_interval)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        # MLOps use: metric extractors that process only new training log lines
+
+
+if __name__ == "__main__":
+    with LogFollower(sys.argv[1], checkpoint_path=sys.argv[2] if len(sys.argv) > 2 else None) as follower:
+        for new_line in follower.follow():
+            print(new_line)
@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+
+"""
+log_search.py - Parallel Log Search Tool
+
+grep-like search over large log files:
+- Memory-maps the file instead of reading it line by line
+- Splits it into newline-aligned chunks searched on a process pool
+- Returns matching lines with line numbers and byte offsets, in file order
+- Usable as a module (search()) or from the command line
+
+Usage:
+    python log_search.py "run_id=7f3a" train.log
+    python log_search.py -i -j 8 "cuda out of memory" train.log
+"""
+
+import argparse
+import mmap
+import os
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+# ============================================================================
+# DEFAULTS - Chunk sizes for splitting and newline counting
+# ============================================================================
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024  # Bytes per task sent to a worker
+COUNT_WINDOW_BYTES = 16 * 1024 * 1024   # Bytes copied at a time while counting lines
+
+LogMatch = namedtuple("LogMatch", ["line_number", "byte_offset", "line"])
+# line_number is 1-based; byte_offset is where the matching line starts
+
+# ============================================================================
+# CHUNKING - Byte ranges that start and end on line boundaries
+# ============================================================================
+
+def _map_file(log_file):
+    return mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def chunk_ranges(path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Split a file into (start, end) byte ranges ending after a newline."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    ranges = []
+    with open(path, "rb") as log_file, _map_file(log_file) as mapped:
+        start = 0
+        while start < size:
+            newline = mapped.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _count_newlines(mapped, start, end):
+    """Newlines in mapped[start:end], copying at most COUNT_WINDOW_BYTES at once."""
+    count = 0
+    for window_start in range(start, end, COUNT_WINDOW_BYTES):
+        count += mapped[window_start:min(window_start + COUNT_WINDOW_BYTES, end)].count(b"\n")
+    return count
+
+# ============================================================================
+# WORKER - Search one chunk of the mapped file
+# ============================================================================
+
+def _search_chunk(task):
+    """Matching lines of one chunk as (line index in chunk, offset, bytes).
+
+    Returns (newlines in chunk, matches) so the parent can turn chunk-local
+    line indexes into file line numbers.
+    """
+    path, pattern, flags, start, end = task
+    regex = re.compile(pattern, flags | re.MULTILINE)
+    matches = []
+    with open(path, "rb") as log_file, _map_file(log_file) as mapped:
+        line_index = 0
+        counted_to = start   # Newlines before this offset are already counted
+        position = start
+        while position < end:
+            match = regex.search(mapped, position, end)
+            if match is None:
+                break
+            if match.start() >= end and mapped[end - 1:end] == b"\n":
+                break  # Empty match after the chunk's last newline: not a line
+            line_start = max(mapped.rfind(b"\n", start, match.start()) + 1, start)
+            line_end = mapped.find(b"\n", match.start(), end)
+            line_end = end if line_end == -1 else line_end
+            line_index += _count_newlines(mapped, counted_to, line_start)
+            counted_to = line_start
+            matches.append((line_index, line_start, mapped[line_start:line_end]))
+            position = line_end + 1  # One result per line, like grep
+        return _count_newlines(mapped, start, end), matches
+
+# ============================================================================
+# SEARCH - Fan chunks out to processes, merge results in file order
+# ============================================================================
+
+def search(path, pattern, ignore_case=False, workers=None,
+           chunk_bytes=DEFAULT_CHUNK_BYTES, encoding="utf-8"):
+    """Yield LogMatch for every line of path matching pattern, in file order.
+
+    Args:
+        path: Log file to search
+        pattern: Regular expression (str); applied to the raw bytes
+        ignore_case: Case-insensitive matching
+        workers: Worker processes (default: os.cpu_count()); 1 searches in-process
+        chunk_bytes: Approximate bytes per worker task
+        encoding: Used to encode the pattern and decode matching lines
+    """
+    flags = re.IGNORECASE if ignore_case else 0
+    pattern_bytes = pattern.encode(encoding)
+    re.compile(pattern_bytes, flags)  # Fail fast on a bad pattern, before forking
+    tasks = [(str(path), pattern_bytes, flags, start, end)
+             for start, end in chunk_ranges(path, chunk_bytes)]
+    if workers == 1 or len(tasks) <= 1:
+        results = map(_search_chunk, tasks)
+        yield from _numbered(results, encoding)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _numbered(executor.map(_search_chunk, tasks), encoding)  # map keeps order
+
+
+def _numbered(chunk_results, encoding):
+    first_line = 1
+    for newline_count, matches in chunk_results:
+        for line_index, byte_offset, line in matches:
+            yield LogMatch(first_line + line_index, byte_offset,
+                           line.rstrip(b"\r").decode(encoding, errors="replace"))
+        first_line += newline_count
+
+# ============================================================================
+# COMMAND LINE - grep-style output: line:offset:text
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search a large log file in parallel.")
+    parser.add_argument("pattern", help="regular expression to search for")
+    parser.add_argument("path", help="log file to search")
+    parser.add_argument("-i", "--ignore-case", action="store_true", help="case-insensitive match")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("-c", "--count", action="store_true", help="only print the number of matching lines")
+    parser.add_argument("--chunk-mb", type=int, default=DEFAULT_CHUNK_BYTES // (1024 * 1024),
+                        help="approximate chunk size per task in MiB")
+    args = parser.parse_args(argv)
+
+    matches = search(args.path, args.pattern, args.ignore_case, args.workers,
+                     args.chunk_mb * 1024 * 1024)
+    if args.count:
+        print(sum(1 for _ in matches))
+        return 0
+    found = False
+    for match in matches:
+        found = True
+        print(f"{match.line_number}:{match.byte_offset}:{match.line}")
+    return 0 if found else 1  # grep convention: 1 when nothing matched
+    # MLOps use: find one run ID in tens of GB of training logs using every core
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+
+"""
+Asynchronous Logging Pipeline for MLOps - Educational Examples
+
+Demonstrates moving log formatting and I/O off the request path:
+- Synchronous logging (basicConfig) writes on the calling thread
+- QueueHandler/QueueListener hand records to a background thread
+- Backpressure policies: drop or sample instead of blocking callers
+- Measuring p99 caller latency before and after
+"""
+
+import logging
+import os
+import tempfile
+import time
+
+from log_setup import benchmark_caller_latency, setup_async_logging
+
+NUM_RECORDS = 20_000
+STALL_EVERY = 200         # Simulate a slow disk or network write...
+STALL_SECONDS = 0.002     # ...of 2 ms every 200 records
+
+class StallingFileHandler(logging.FileHandler):
+    """FileHandler with periodic write stalls, like a busy disk or log shipper."""
+    def emit(self, record):
+        super().emit(record)
+        self.emitted = getattr(self, "emitted", 0) + 1
+        if self.emitted % STALL_EVERY == 0:
+            time.sleep(STALL_SECONDS)
+
+with tempfile.TemporaryDirectory() as log_dir:
+
+    # ============================================================================
+    # SYNCHRONOUS LOGGING - Formatting and file I/O on the calling thread
+    # ============================================================================
+
+    sync_logger = logging.getLogger("serving.sync")
+    sync_logger.propagate = False
+    sync_handler = StallingFileHandler(os.path.join(log_dir, "sync.log"))
+    sync_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    sync_logger.addHandler(sync_handler)
+    sync_logger.setLevel(logging.INFO)
+
+    sync_latency = benchmark_caller_latency(sync_logger, NUM_RECORDS)
+    sync_handler.close()
+    # Every call pays for formatting, the write() syscall and any disk stall
+
+    # ============================================================================
+    # ASYNCHRONOUS LOGGING - Caller only enqueues the record
+    # ============================================================================
+
+    async_logger = logging.getLogger("serving.async")
+    async_logger.propagate = False
+    listener = setup_async_logging(
+        handlers=[StallingFileHandler(os.path.join(log_dir, "async.log"))],
+        logger=async_logger,
+        queue_size=NUM_RECORDS,  # Large enough that the benchmark drops nothing
+        policy="sample",         # Under pressure keep 10% of INFO, all WARNING+
+    )
+
+    async_latency = benchmark_caller_latency(async_logger, NUM_RECORDS)
+    listener.stop()  # Drain the queue before reading the results
+    dropped = listener.queue_handler.dropped
+    for handler in listener.handlers:
+        handler.close()
+    # MLOps use: logging in model-serving request paths without tail latency
+
+    # ============================================================================
+    # RESULTS - Caller latency in microseconds
+    # ============================================================================
+
+    print(f"sync  p50={sync_latency['p50']:.1f}us  p99={sync_latency['p99']:.1f}us")
+    print(f"async p50={async_latency['p50']:.1f}us  p99={async_latency['p99']:.1f}us")
+    print(f"records dropped under backpressure: {dropped}")
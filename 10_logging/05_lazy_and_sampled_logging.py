@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+
+"""
+Lazy and Sampled Logging for MLOps - Educational Examples
+
+Demonstrates keeping debug logging cheap in hot loops:
+- f-strings passed to logging.debug() are built even when DEBUG is off
+- Callables defer message construction until the level is enabled
+- Per-call-site sampling and rate limiting keep DEBUG from flooding disks
+"""
+
+import logging
+import time
+
+from log_setup import SampledLogger
+
+NUM_BATCHES = 100_000
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(filename)s:%(lineno)d - %(message)s")
+logger = logging.getLogger("training")
+
+
+def expensive_summary(batch_index):
+    return f"batch {batch_index}: " + ", ".join(f"{x:.3f}" for x in range(50))
+
+# ============================================================================
+# EAGER DEBUG MESSAGES - Built and thrown away when DEBUG is off
+# ============================================================================
+
+started = time.perf_counter()
+for batch_index in range(NUM_BATCHES):
+    logger.debug(expensive_summary(batch_index))  # String built, then discarded
+eager_seconds = time.perf_counter() - started
+
+# ============================================================================
+# LAZY DEBUG MESSAGES - Callable only runs when the level is enabled
+# ============================================================================
+
+log = SampledLogger(logger)
+started = time.perf_counter()
+for batch_index in range(NUM_BATCHES):
+    log.debug(lambda: expensive_summary(batch_index))  # Never called at INFO
+lazy_seconds = time.perf_counter() - started
+
+print(f"eager debug: {eager_seconds:.3f}s  lazy debug: {lazy_seconds:.3f}s")
+
+# ============================================================================
+# SAMPLED LOGGING - At most 5 records per second from this call site
+# ============================================================================
+
+logger.setLevel(logging.DEBUG)
+log = SampledLogger(logger, max_per_second=5)
+for batch_index in range(NUM_BATCHES):
+    log.debug(lambda: f"batch {batch_index} loss={1 / (batch_index + 1):.4f}")
+print(f"suppressed records per call site: {list(log.suppressed.values())}")
+# MLOps use: leave DEBUG on in production training jobs without drowning in output
@@ -0,0 +1,306 @@
+#!/usr/bin/python3
+
+"""
+log_setup.py - Production Logging Setup Module
+
+Reusable logging configuration for MLOps services:
+- Moves formatting and I/O off the calling thread (QueueHandler/QueueListener)
+- Never blocks callers on a full queue: drops or samples low-severity records
+- Structured JSON formatter with cached per-logger layouts and timestamps
+- Lazy messages and per-call-site sampling for high-frequency debug logs
+- Benchmark helper comparing caller latency of sync and async setups
+- Can be imported by the numbered examples and by real services
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import time
+from json.encoder import encode_basestring
+
+# ============================================================================
+# DEFAULTS - Queue size, backpressure behaviour and format
+# ============================================================================
+
+DEFAULT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+DEFAULT_QUEUE_SIZE = 10_000    # Records buffered between callers and the listener
+DEFAULT_SAMPLE_RATE = 0.1      # Fraction of low-severity records kept under pressure
+DEFAULT_HIGH_WATERMARK = 0.8   # Queue fill level at which sampling starts
+BACKPRESSURE_POLICIES = ("drop", "sample", "block")
+
+# ============================================================================
+# QUEUE HANDLER - Caller side: enqueue and return immediately
+# ============================================================================
+
+class BackpressureQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that applies a backpressure policy instead of blocking.
+
+    Policies:
+    - "drop": enqueue without waiting; drop the record if the queue is full
+    - "sample": above the high watermark keep only sample_rate of records
+      below WARNING; WARNING and above are only dropped if the queue is full
+      (an unbounded queue, maxsize <= 0, never samples)
+    - "block": wait for space (never loses records, but can stall callers)
+
+    Dropped records are counted in self.dropped.
+    """
+
+    def __init__(self, log_queue, policy="drop", sample_rate=DEFAULT_SAMPLE_RATE,
+                 high_watermark=DEFAULT_HIGH_WATERMARK):
+        super().__init__(log_queue)
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"policy must be one of {BACKPRESSURE_POLICIES}")
+        self.policy = policy
+        self.sample_rate = sample_rate
+        if log_queue.maxsize > 0:
+            self._sampling_threshold = int(log_queue.maxsize * high_watermark)
+        else:
+            self._sampling_threshold = None  # Unbounded queue: never under pressure
+        self.dropped = 0
+
+    def prepare(self, record):
+        """Merge args into the message, without the formatting and copy of the default.
+
+        The queue never leaves this process, so the record does not need to
+        be made picklable; handlers format it on the listener thread.
+        """
+        record.msg = record.getMessage()  # Freeze mutable args at call time
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        if (self.policy == "sample" and self._sampling_threshold is not None
+                and record.levelno < logging.WARNING
+                and self.queue.qsize() >= self._sampling_threshold
+                and random.random() >= self.sample_rate):
+            self.dropped += 1
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+# ============================================================================
+# QUEUE LISTENER - Background side: format and write records
+# ============================================================================
+
+class BackgroundListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() drains the queue even when it is full."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)  # Wait for space instead of raising queue.Full
+
+    def stop(self):
+        """Write out every queued record, then stop the thread (safe to call twice)."""
+        if self._thread is not None:
+            super().stop()
+
+
+def setup_async_logging(level=logging.INFO, handlers=None, fmt=DEFAULT_FORMAT,
+                        queue_size=DEFAULT_QUEUE_SIZE, policy="drop",
+                        sample_rate=DEFAULT_SAMPLE_RATE, logger=None):
+    """Configure a logger to format and write records on a background thread.
+
+    Args:
+        level: Minimum level for the logger
+        handlers: Real output handlers (default: one StreamHandler to stderr);
+            handlers without a formatter get one built from fmt
+        fmt: Format string for handlers without a formatter
+        queue_size: Maximum queued records before the policy applies
+            (0 or less: unbounded, so no record is ever dropped)
+        policy: Backpressure policy - "drop", "sample" or "block"
+        sample_rate: Fraction of low-severity records kept when sampling
+        logger: Logger to configure (default: root logger); its existing
+            handlers are replaced, like logging.basicConfig(force=True)
+
+    Returns:
+        The started BackgroundListener. Its queue_handler attribute exposes
+        the dropped-record count; stop() is also registered with atexit.
+    """
+    handlers = handlers or [logging.StreamHandler()]
+    formatter = logging.Formatter(fmt)
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(maxsize=queue_size)
+    queue_handler = BackpressureQueueHandler(log_queue, policy, sample_rate)
+    target_logger = logger or logging.getLogger()
+    for old_handler in list(target_logger.handlers):
+        target_logger.removeHandler(old_handler)
+    target_logger.addHandler(queue_handler)
+    target_logger.setLevel(level)
+
+    listener = BackgroundListener(log_queue, *handlers, respect_handler_level=True)
+    listener.queue_handler = queue_handler
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on interpreter exit
+    return listener
+    # MLOps use: keep logging out of the request path of model-serving APIs
+
+# ============================================================================
+# JSON FORMATTER - One JSON object per record, built by string concatenation
+# ============================================================================
+
+_RECORD_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {"message", "asctime"}
+_BASE_ATTR_COUNT = len(logging.LogRecord("", 0, "", 0, "", None, None).__dict__)
+
+
+def _json_value(value):
+    if isinstance(value, str):
+        return encode_basestring(value)
+    return json.dumps(value, default=str)
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects.
+
+    Output: {"timestamp": ..., "level": ..., "logger": ..., "message": ...,
+    <extra fields>, "exc_info": ...}. Built without per-record dicts:
+    - the '"level":..,"logger":..,"message":' segment is cached per
+      (logger, level), so names are escaped once
+    - the timestamp string is cached per second; only milliseconds change
+    - only the message and extra= fields are escaped for each record
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._layouts = {}            # (logger name, levelno) -> cached middle segment
+        self._cached_second = None
+        self._cached_timestamp = ""
+
+    def _layout(self, record):
+        key = (record.name, record.levelno)
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = (f',"level":{encode_basestring(record.levelname)}'
+                      f',"logger":{encode_basestring(record.name)},"message":')
+            self._layouts[key] = layout
+        return layout
+
+    def _timestamp(self, record):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f'{{"timestamp":"{self._cached_timestamp}.{int(record.msecs):03d}Z"'
+
+    def format(self, record):
+        line = self._timestamp(record) + self._layout(record) + encode_basestring(record.getMessage())
+        attrs = record.__dict__
+        if len(attrs) > _BASE_ATTR_COUNT:  # Only look for extra= fields when there can be some
+            for key, value in attrs.items():
+                if key not in _RECORD_ATTRS:
+                    line += f",{encode_basestring(key)}:{_json_value(value)}"
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line += ',"exc_info":' + encode_basestring(record.exc_text)
+        return line + "}"
+        # MLOps use: logs that log shippers and query engines can parse directly
+
+# ============================================================================
+# LAZY AND SAMPLED LOGGING - Pay for debug messages only when they are kept
+# ============================================================================
+
+class SampledLogger:
+    """Logger wrapper that skips disabled levels and samples per call site.
+
+    msg may be a callable returning the message; it is only called once the
+    level is enabled and the call site's sample is kept, so expensive
+    strings (array summaries, config dumps) cost nothing otherwise:
+
+        log = SampledLogger(logging.getLogger(__name__), max_per_second=10)
+        log.debug(lambda: f"batch stats: {batch.mean(axis=0)}")
+
+    Sampling is per call site (code object + line number):
+    - sample_rate: probability of keeping each record (1.0 keeps all)
+    - max_per_second: token bucket allowing at most this many records per
+      second per site, with bursts up to the same number (None: no limit)
+    Suppressed records are counted per site in self.suppressed.
+    """
+
+    def __init__(self, logger, sample_rate=1.0, max_per_second=None):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.logger = logger
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self._buckets = {}     # Call site -> [tokens, last refill time]
+        self.suppressed = {}   # Call site -> suppressed record count
+
+    def _keep(self, site):
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+        if self.max_per_second is None:
+            return True
+        now = time.monotonic()
+        bucket = self._buckets.get(site)
+        if bucket is None:
+            bucket = self._buckets[site] = [float(self.max_per_second), now]
+        tokens = min(self.max_per_second, bucket[0] + (now - bucket[1]) * self.max_per_second)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - 1
+        return True
+
+    def log(self, level, msg, *args, **kwargs):
+        if not self.logger.isEnabledFor(level):
+            return  # Nothing evaluated, no frame inspection
+        depth = 1
+        frame = sys._getframe(1)
+        if frame.f_code.co_filename == __file__:  # Called via debug()/info()/...
+            frame = frame.f_back
+            depth = 2
+        site = (frame.f_code, frame.f_lineno)
+        if not self._keep(site):
+            self.suppressed[site] = self.suppressed.get(site, 0) + 1
+            return
+        if callable(msg):
+            msg = msg()
+        kwargs.setdefault("stacklevel", depth + 1)  # Report the caller's file and line
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def debug(self, msg, *args, **kwargs):
+        self.log(logging.DEBUG, msg, *args, **kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        self.log(logging.INFO, msg, *args, **kwargs)
+
+    def warning(self, msg, *args, **kwargs):
+        self.log(logging.WARNING, msg, *args, **kwargs)
+
+    def error(self, msg, *args, **kwargs):
+        self.log(logging.ERROR, msg, *args, **kwargs)
+
+    def critical(self, msg, *args, **kwargs):
+        self.log(logging.CRITICAL, msg, *args, **kwargs)
+        # MLOps use: per-batch debug output in training loops without flooding the disk
+
+# ============================================================================
+# BENCHMARK - Caller latency of a logging setup
+# ============================================================================
+
+def benchmark_caller_latency(logger, num_records=10_000, quantiles=(0.5, 0.99)):
+    """Time each logger.info() call as seen by the caller.
+
+    Returns:
+        Dict of quantile label (e.g. "p99") -> latency in microseconds
+    """
+    latencies = []
+    for index in range(num_records):
+        started = time.perf_counter_ns()
+        logger.info("request %d served in %.2f ms", index, 12.5)
+        latencies.append(time.perf_counter_ns() - started)
+    latencies.sort()
+    return {f"p{q * 100:g}": latencies[min(len(latencies) - 1, int(q * len(latencies)))] / 1000
+            for q in quantiles}